@@ -3,6 +3,7 @@ GIS Data Router
 Serves Montgomery County GIS layers (fire boxes, stations, etc.)
 """
 import os
+import gzip
 import json
 from pathlib import Path
 from fastapi import APIRouter, HTTPException
@@ -33,6 +34,25 @@ def get_gis_data_path() -> Path:
     return gis_path
 
 
+def load_geojson(path: Path) -> dict:
+    """
+    Load a GeoJSON file, preferring its gzipped copy when one is up to date.
+
+    Args:
+        path: Path to the .geojson file
+
+    Returns:
+        dict: Parsed GeoJSON
+    """
+    gz_path = path.with_name(path.name + ".gz")
+    if gz_path.exists() and (not path.exists() or gz_path.stat().st_mtime >= path.stat().st_mtime):
+        with gzip.open(gz_path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 @router.get("/fire-boxes")
 async def get_fire_boxes():
     """
@@ -63,8 +83,7 @@ async def get_fire_boxes():
         logger.info(f"File size: {fire_boxes_file.stat().st_size / 1024:.1f} KB")
 
         # Read GeoJSON file
-        with open(fire_boxes_file, 'r', encoding='utf-8') as f:
-            geojson_data = json.load(f)
+        geojson_data = load_geojson(fire_boxes_file)
 
         # Validate structure
         if 'type' not in geojson_data or geojson_data['type'] != 'FeatureCollection':
@@ -110,9 +129,8 @@ async def gis_debug():
     if fire_boxes_file.exists():
         result["file_size_kb"] = round(fire_boxes_file.stat().st_size / 1024, 2)
         try:
-            with open(fire_boxes_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                result["feature_count"] = len(data.get('features', []))
+            data = load_geojson(fire_boxes_file)
+            result["feature_count"] = len(data.get('features', []))
         except Exception as e:
             result["error"] = str(e)
 
@@ -135,9 +153,8 @@ async def gis_health():
 
     if fire_boxes_available:
         try:
-            with open(fire_boxes_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                fire_boxes_count = len(data.get('features', []))
+            data = load_geojson(fire_boxes_file)
+            fire_boxes_count = len(data.get('features', []))
         except Exception as e:
             logger.error(f"Error reading fire boxes for health check: {e}")
             fire_boxes_available = False
@@ -15,15 +15,29 @@ Usage:
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / "data" / "gis"
 
 # HIFLD Hospital endpoint
 HIFLD_HOSPITALS_URL = "https://services1.arcgis.com/Hp6G80Pky0om7QvQ/arcgis/rest/services/Hospitals_1/FeatureServer/0/query"
 
+# HIFLD attributes read by normalize_hospital()
+HIFLD_HOSPITAL_FIELDS = ",".join([
+    "NAME", "ADDRESS", "CITY", "STATE", "ZIP", "TELEPHONE", "TYPE", "TRAUMA",
+    "HELIPAD", "BEDS", "OWNER", "STATUS", "LONGITUDE", "LATITUDE",
+])
+
 # CMS Nursing Homes
 CMS_NURSING_HOMES_URL = "https://data.cms.gov/provider-data/api/1/datastore/query/4pq5-n9py"
 
@@ -42,6 +56,13 @@ MOCO_BOUNDS = {
 }
 
 
+def parse_json(response):
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def download_hifld_hospitals():
     """Download hospitals from HIFLD."""
     print("Downloading hospitals from HIFLD...")
@@ -51,15 +72,16 @@ def download_hifld_hospitals():
     for state in STATES:
         params = {
             "where": f"STATE='{state}'",
-            "outFields": "*",
-            "f": "geojson",
+            "outFields": HIFLD_HOSPITAL_FIELDS,
+            "outSR": "4326",
+            "f": "json",
             "resultRecordCount": 1000
         }
 
         try:
             response = requests.get(HIFLD_HOSPITALS_URL, params=params, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             features = data.get("features", [])
             print(f"  Found {len(features)} hospitals in {state}")
@@ -84,7 +106,7 @@ def download_dc_hospitals():
     try:
         response = requests.get(DC_HOSPITALS_URL, params=params, timeout=30)
         response.raise_for_status()
-        data = response.json()
+        data = parse_json(response)
 
         features = data.get("features", [])
         print(f"  Found {len(features)} DC facilities")
@@ -113,7 +135,7 @@ def download_cms_nursing_homes():
             response = requests.get(url, timeout=30)
 
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 records = data.get("results", [])
                 print(f"  Found {len(records)} nursing homes in {state}")
                 all_records.extend(records)
@@ -127,14 +149,21 @@ def download_cms_nursing_homes():
 
 
 def normalize_hospital(feature, source="hifld"):
-    """Normalize hospital data to common format."""
-    props = feature.get("properties", {})
-    geom = feature.get("geometry", {})
+    """
+    Normalize hospital data to common format.
+
+    Accepts both GeoJSON features (properties + Point geometry) and Esri
+    JSON features (attributes + {x, y} geometry) as returned by f=json.
+    """
+    props = feature.get("properties") or feature.get("attributes") or {}
+    geom = feature.get("geometry") or {}
 
     # Get coordinates
     coords = None
     if geom.get("type") == "Point":
         coords = geom.get("coordinates")
+    elif geom.get("x") is not None and geom.get("y") is not None:
+        coords = [geom["x"], geom["y"]]
     elif "LONGITUDE" in props and "LATITUDE" in props:
         coords = [float(props["LONGITUDE"]), float(props["LATITUDE"])]
 
@@ -188,114 +217,197 @@ def normalize_hospital(feature, source="hifld"):
     }
 
 
-def normalize_nursing_home(record):
-    """Normalize CMS nursing home data."""
-    try:
-        lat = float(record.get("latitude", 0))
-        lng = float(record.get("longitude", 0))
-
-        if lat == 0 or lng == 0:
-            return None
-
+@dataclass(slots=True)
+class NursingHome:
+    """A normalized CMS nursing home record."""
+    lng: float
+    lat: float
+    name: str
+    address: str
+    city: str
+    state: str
+    zip: str
+    phone: str
+    beds: int
+    rating: str
+    ownership: str
+
+    def to_feature(self):
+        """Convert to a GeoJSON Feature."""
         return {
             "type": "Feature",
             "geometry": {
                 "type": "Point",
-                "coordinates": [lng, lat]
+                "coordinates": [self.lng, self.lat]
             },
             "properties": {
-                "name": record.get("provider_name", "Unknown"),
-                "address": record.get("provider_address", ""),
-                "city": record.get("provider_city", ""),
-                "state": record.get("provider_state", ""),
-                "zip": record.get("provider_zip_code", ""),
-                "phone": record.get("provider_phone_number", ""),
-                "beds": int(record.get("number_of_certified_beds", 0) or 0),
-                "rating": record.get("overall_rating", ""),
-                "ownership": record.get("ownership_type", ""),
+                "name": self.name,
+                "address": self.address,
+                "city": self.city,
+                "state": self.state,
+                "zip": self.zip,
+                "phone": self.phone,
+                "beds": self.beds,
+                "rating": self.rating,
+                "ownership": self.ownership,
                 "source": "cms"
             }
         }
-    except (ValueError, TypeError):
-        return None
+
+
+def normalize_nursing_home(record):
+    """Normalize CMS nursing home data."""
+    rows = normalize_nursing_homes([record])
+    return rows[0].to_feature() if rows else None
+
+
+def normalize_nursing_homes(records):
+    """
+    Normalize a batch of CMS nursing home records.
+
+    Returns NursingHome rows rather than GeoJSON dicts; records without a
+    usable location are dropped before anything is allocated for them.
+    """
+    rows = []
+    append = rows.append
+    for record in records:
+        get = record.get
+        try:
+            lat = float(get("latitude", 0))
+            lng = float(get("longitude", 0))
+            if lat == 0 or lng == 0:
+                continue
+            beds = int(get("number_of_certified_beds", 0) or 0)
+        except (ValueError, TypeError):
+            continue
+
+        append(NursingHome(
+            lng=lng,
+            lat=lat,
+            name=get("provider_name", "Unknown"),
+            address=get("provider_address", ""),
+            city=get("provider_city", ""),
+            state=get("provider_state", ""),
+            zip=get("provider_zip_code", ""),
+            phone=get("provider_phone_number", ""),
+            beds=beds,
+            rating=get("overall_rating", ""),
+            ownership=get("ownership_type", ""),
+        ))
+    return rows
+
+
+def filter_rows_by_bounds(rows, bounds):
+    """Filter NursingHome rows to those within bounding box."""
+    min_lat, max_lat = bounds["min_lat"], bounds["max_lat"]
+    min_lng, max_lng = bounds["min_lng"], bounds["max_lng"]
+    return [row for row in rows
+            if min_lat <= row.lat <= max_lat and min_lng <= row.lng <= max_lng]
 
 
 def filter_by_bounds(features, bounds):
     """Filter features to those within bounding box."""
+    min_lat, max_lat = bounds["min_lat"], bounds["max_lat"]
+    min_lng, max_lng = bounds["min_lng"], bounds["max_lng"]
+
     filtered = []
     for f in features:
         coords = f.get("geometry", {}).get("coordinates", [])
-        if len(coords) >= 2:
-            lng, lat = coords[0], coords[1]
-            if (bounds["min_lat"] <= lat <= bounds["max_lat"] and
-                bounds["min_lng"] <= lng <= bounds["max_lng"]):
-                filtered.append(f)
+        if (len(coords) >= 2
+                and min_lat <= coords[1] <= max_lat
+                and min_lng <= coords[0] <= max_lng):
+            filtered.append(f)
     return filtered
 
 
-def add_maryland_specialty_centers(hospitals):
-    """Add Maryland specialty center designations based on known data."""
-    # Known trauma centers from Maryland TraumaNET
-    TRAUMA_CENTERS = {
-        "R ADAMS COWLEY SHOCK TRAUMA CENTER": {"trauma_level": 1, "is_trauma_center": True},
-        "JOHNS HOPKINS HOSPITAL": {"trauma_level": 1, "is_trauma_center": True},
-        "UNIVERSITY OF MARYLAND MEDICAL CENTER": {"trauma_level": 1, "is_trauma_center": True},
-        "SUBURBAN HOSPITAL": {"trauma_level": 2, "is_trauma_center": True},
-        "MEDSTAR WASHINGTON HOSPITAL CENTER": {"trauma_level": 1, "is_trauma_center": True},
-        "CHILDREN'S NATIONAL MEDICAL CENTER": {"trauma_level": 1, "is_trauma_center": True, "is_pediatric": True},
-        "PRINCE GEORGE'S HOSPITAL CENTER": {"trauma_level": 2, "is_trauma_center": True},
-        "HOLY CROSS HOSPITAL": {"trauma_level": 2, "is_trauma_center": True},
-    }
+# Known trauma centers from Maryland TraumaNET
+TRAUMA_CENTERS = {
+    "R ADAMS COWLEY SHOCK TRAUMA CENTER": {"trauma_level": 1, "is_trauma_center": True},
+    "JOHNS HOPKINS HOSPITAL": {"trauma_level": 1, "is_trauma_center": True},
+    "UNIVERSITY OF MARYLAND MEDICAL CENTER": {"trauma_level": 1, "is_trauma_center": True},
+    "SUBURBAN HOSPITAL": {"trauma_level": 2, "is_trauma_center": True},
+    "MEDSTAR WASHINGTON HOSPITAL CENTER": {"trauma_level": 1, "is_trauma_center": True},
+    "CHILDREN'S NATIONAL MEDICAL CENTER": {"trauma_level": 1, "is_trauma_center": True, "is_pediatric": True},
+    "PRINCE GEORGE'S HOSPITAL CENTER": {"trauma_level": 2, "is_trauma_center": True},
+    "HOLY CROSS HOSPITAL": {"trauma_level": 2, "is_trauma_center": True},
+}
+
+# Known STEMI centers
+STEMI_CENTERS = (
+    "SUBURBAN HOSPITAL",
+    "HOLY CROSS HOSPITAL",
+    "ADVENTIST HEALTHCARE SHADY GROVE",
+    "MEDSTAR MONTGOMERY",
+    "ADVENTIST HEALTHCARE WHITE OAK",
+    "JOHNS HOPKINS HOSPITAL",
+    "MEDSTAR WASHINGTON HOSPITAL CENTER",
+    "GEORGE WASHINGTON UNIVERSITY HOSPITAL",
+    "HOWARD UNIVERSITY HOSPITAL",
+)
+
+# Known stroke centers
+STROKE_CENTERS = (
+    "SUBURBAN HOSPITAL",
+    "HOLY CROSS HOSPITAL",
+    "ADVENTIST HEALTHCARE SHADY GROVE",
+    "MEDSTAR MONTGOMERY",
+    "ADVENTIST HEALTHCARE WHITE OAK",
+    "JOHNS HOPKINS HOSPITAL",
+    "MEDSTAR WASHINGTON HOSPITAL CENTER",
+    "GEORGE WASHINGTON UNIVERSITY HOSPITAL",
+)
+
+
+@lru_cache(maxsize=None)
+def specialty_attrs(name):
+    """Return the specialty designations that apply to a hospital name."""
+    name = name.upper()
+    attrs = {}
+
+    # Check trauma centers
+    for center_name, center_attrs in TRAUMA_CENTERS.items():
+        if center_name in name:
+            attrs.update(center_attrs)
+            break
+
+    # Check STEMI centers
+    if any(center in name for center in STEMI_CENTERS):
+        attrs["is_stemi_center"] = True
+
+    # Check stroke centers
+    if any(center in name for center in STROKE_CENTERS):
+        attrs["is_stroke_center"] = True
+
+    return attrs
 
-    # Known STEMI centers
-    STEMI_CENTERS = [
-        "SUBURBAN HOSPITAL",
-        "HOLY CROSS HOSPITAL",
-        "ADVENTIST HEALTHCARE SHADY GROVE",
-        "MEDSTAR MONTGOMERY",
-        "ADVENTIST HEALTHCARE WHITE OAK",
-        "JOHNS HOPKINS HOSPITAL",
-        "MEDSTAR WASHINGTON HOSPITAL CENTER",
-        "GEORGE WASHINGTON UNIVERSITY HOSPITAL",
-        "HOWARD UNIVERSITY HOSPITAL",
-    ]
-
-    # Known stroke centers
-    STROKE_CENTERS = [
-        "SUBURBAN HOSPITAL",
-        "HOLY CROSS HOSPITAL",
-        "ADVENTIST HEALTHCARE SHADY GROVE",
-        "MEDSTAR MONTGOMERY",
-        "ADVENTIST HEALTHCARE WHITE OAK",
-        "JOHNS HOPKINS HOSPITAL",
-        "MEDSTAR WASHINGTON HOSPITAL CENTER",
-        "GEORGE WASHINGTON UNIVERSITY HOSPITAL",
-    ]
 
+def add_maryland_specialty_centers(hospitals):
+    """Add Maryland specialty center designations based on known data."""
     for hospital in hospitals:
-        name = hospital["properties"]["name"].upper()
-
-        # Check trauma centers
-        for center_name, attrs in TRAUMA_CENTERS.items():
-            if center_name in name:
-                hospital["properties"].update(attrs)
-                break
-
-        # Check STEMI centers
-        for center in STEMI_CENTERS:
-            if center in name:
-                hospital["properties"]["is_stemi_center"] = True
-                break
-
-        # Check stroke centers
-        for center in STROKE_CENTERS:
-            if center in name:
-                hospital["properties"]["is_stroke_center"] = True
-                break
+        attrs = specialty_attrs(hospital["properties"]["name"])
+        if attrs:
+            hospital["properties"].update(attrs)
 
     return hospitals
 
 
+def write_geojson(path, geojson_data, default=None):
+    """
+    Write a GeoJSON FeatureCollection to disk.
+
+    The file is left untouched (keeping its mtime) when its content would
+    not change. Returns True if the file was written.
+    """
+    payload = json.dumps(geojson_data, indent=2, default=default).encode("utf-8")
+
+    if path.exists() and path.stat().st_size == len(payload) and path.read_bytes() == payload:
+        return False
+
+    with open(path, "wb") as f:
+        f.write(payload)
+    return True
+
+
 def main():
     parser = argparse.ArgumentParser(description="Download hospital and nursing home data")
     parser.add_argument("--include-dc", action="store_true", help="Include DC facilities")
@@ -345,37 +457,46 @@ def main():
         "features": hospitals
     }
 
-    hospitals_file = DATA_DIR / "hospitals.geojson"
-    with open(hospitals_file, "w") as f:
-        json.dump(hospitals_geojson, f, indent=2)
-    print(f"\nSaved {len(hospitals)} hospitals to {hospitals_file}")
+    # Files are written on a background thread so the hospital write
+    # overlaps the nursing home download; leaving the with block waits for
+    # pending writes even if the download or filtering raises
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        hospitals_file = DATA_DIR / "hospitals.geojson"
+        hospitals_write = writer.submit(write_geojson, hospitals_file, hospitals_geojson)
 
-    # Download nursing homes
-    print()
-    cms_nursing_homes = download_cms_nursing_homes()
+        # Download nursing homes
+        print()
+        cms_nursing_homes = download_cms_nursing_homes()
 
-    nursing_homes = []
-    for nh in cms_nursing_homes:
-        normalized = normalize_nursing_home(nh)
-        if normalized:
-            nursing_homes.append(normalized)
+        nursing_homes = normalize_nursing_homes(cms_nursing_homes)
 
-    print(f"\nTotal nursing homes before filtering: {len(nursing_homes)}")
+        print(f"\nTotal nursing homes before filtering: {len(nursing_homes)}")
 
-    if args.filter_bounds:
-        nursing_homes = filter_by_bounds(nursing_homes, MOCO_BOUNDS)
-        print(f"Nursing homes after filtering: {len(nursing_homes)}")
+        if args.filter_bounds:
+            nursing_homes = filter_rows_by_bounds(nursing_homes, MOCO_BOUNDS)
+            print(f"Nursing homes after filtering: {len(nursing_homes)}")
 
-    # Save nursing homes
-    nursing_homes_geojson = {
-        "type": "FeatureCollection",
-        "features": nursing_homes
-    }
+        # Save nursing homes
+        nursing_homes_geojson = {
+            "type": "FeatureCollection",
+            "features": nursing_homes
+        }
 
-    nursing_homes_file = DATA_DIR / "nursing_homes.geojson"
-    with open(nursing_homes_file, "w") as f:
-        json.dump(nursing_homes_geojson, f, indent=2)
-    print(f"Saved {len(nursing_homes)} nursing homes to {nursing_homes_file}")
+        # Rows are expanded to GeoJSON features one at a time while encoding
+        nursing_homes_file = DATA_DIR / "nursing_homes.geojson"
+        nursing_homes_write = writer.submit(
+            write_geojson, nursing_homes_file, nursing_homes_geojson, NursingHome.to_feature
+        )
+
+    print()
+    if hospitals_write.result():
+        print(f"Saved {len(hospitals)} hospitals to {hospitals_file}")
+    else:
+        print(f"Hospitals unchanged: {hospitals_file}")
+    if nursing_homes_write.result():
+        print(f"Saved {len(nursing_homes)} nursing homes to {nursing_homes_file}")
+    else:
+        print(f"Nursing homes unchanged: {nursing_homes_file}")
 
     # Print sample
     print("\n" + "=" * 60)
@@ -398,9 +519,8 @@ def main():
     print("Sample nursing homes:")
     print("=" * 60)
     for nh in nursing_homes[:5]:
-        props = nh["properties"]
-        print(f"  {props['name']}")
-        print(f"    {props['address']}, {props['city']}")
+        print(f"  {nh.name}")
+        print(f"    {nh.address}, {nh.city}")
 
     print("\nDone!")
 
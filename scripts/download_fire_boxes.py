@@ -4,11 +4,19 @@ Downloads fire box boundaries from MoCo GIS server
 
 Handles pagination since ArcGIS REST API limits responses to 1000 features.
 """
+import gzip
 import os
 import sys
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # MoCo GIS Fire Box Service - ArcGIS Open Data Hub (direct GeoJSON download)
@@ -21,18 +29,99 @@ FIRE_BOX_URL_FALLBACK = "https://gis3.montgomerycountymd.gov/arcgis/rest/service
 # ArcGIS default page size for REST API fallback
 PAGE_SIZE = 1000
 
+# Pages fetched at once when the feature count is known up front
+MAX_CONCURRENT_PAGES = 5
+
 
 def get_project_root():
     """Get the project root directory"""
     return Path(__file__).parent.parent
 
 
+def parse_json(response):
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def query_arcgis(url: str, params: dict, timeout: int) -> dict:
+    """
+    Run a single ArcGIS REST query and return the parsed response.
+
+    Raises:
+        Exception: If the server returns an ArcGIS error payload
+    """
+    response = requests.get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+
+    data = parse_json(response)
+
+    # Check for error response
+    if 'error' in data:
+        raise Exception(f"ArcGIS error: {data['error'].get('message', 'Unknown error')}")
+
+    return data
+
+
+def fetch_feature_count(url: str, timeout: int = 60) -> Optional[int]:
+    """
+    Ask the ArcGIS server how many features the layer holds.
+
+    Returns:
+        int or None: Feature count, or None if the server didn't report one
+    """
+    try:
+        data = query_arcgis(url, {'where': '1=1', 'returnCountOnly': 'true', 'f': 'json'}, timeout)
+    except Exception as e:
+        print(f"  Count query failed ({e}), paging sequentially")
+        return None
+
+    count = data.get('count')
+    return count if isinstance(count, int) else None
+
+
+def fetch_page(url: str, offset: int, timeout: int = 60) -> dict:
+    """Fetch one page of features starting at offset."""
+    params = {
+        'where': '1=1',  # Get all features
+        'outFields': '*',  # All attributes
+        'outSR': '4326',  # WGS84 (standard lat/lng)
+        'f': 'geojson',  # GeoJSON format
+        'resultOffset': offset,
+        'resultRecordCount': PAGE_SIZE
+    }
+
+    print(f"  Fetching features {offset} to {offset + PAGE_SIZE}...")
+    return query_arcgis(url, params, timeout)
+
+
+def exceeded_transfer_limit(data: dict, features: list) -> bool:
+    """
+    Check whether more pages follow this one.
+
+    ArcGIS reports exceededTransferLimit at the top level for f=json and
+    under "properties" for f=geojson. Older servers omit it, in which case
+    a full page is taken to mean there may be more.
+    """
+    flag = data.get('exceededTransferLimit')
+    if flag is None:
+        flag = (data.get('properties') or {}).get('exceededTransferLimit')
+    if flag is None:
+        return len(features) >= PAGE_SIZE
+    return bool(flag)
+
+
 def fetch_with_pagination(url: str, timeout: int = 60) -> list:
     """
     Fetch all features from ArcGIS REST API with pagination.
 
     ArcGIS servers limit responses to ~1000 features per request.
-    This function fetches all pages and combines them.
+    When the server reports a feature count up front, all pages are
+    fetched concurrently; otherwise pages are fetched one after another
+    until the server says there are no more. If any concurrent page comes
+    back short (the server caps records per request below PAGE_SIZE), the
+    fixed offsets would skip records, so paging restarts sequentially.
 
     Args:
         url: The ArcGIS REST API query endpoint
@@ -44,26 +133,30 @@ def fetch_with_pagination(url: str, timeout: int = 60) -> list:
     all_features = []
     offset = 0
 
-    while True:
-        params = {
-            'where': '1=1',  # Get all features
-            'outFields': '*',  # All attributes
-            'outSR': '4326',  # WGS84 (standard lat/lng)
-            'f': 'geojson',  # GeoJSON format
-            'resultOffset': offset,
-            'resultRecordCount': PAGE_SIZE
-        }
-
-        print(f"  Fetching features {offset} to {offset + PAGE_SIZE}...")
-        response = requests.get(url, params=params, timeout=timeout)
-        response.raise_for_status()
-
-        data = response.json()
-
-        # Check for error response
-        if 'error' in data:
-            raise Exception(f"ArcGIS error: {data['error'].get('message', 'Unknown error')}")
+    count = fetch_feature_count(url, timeout)
+    if count:
+        print(f"  Server reports {count} features")
+        offsets = range(0, count, PAGE_SIZE)
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as pool:
+            pages = list(pool.map(lambda o: fetch_page(url, o, timeout), offsets))
+
+        short_page = any(len(data.get('features', [])) < min(PAGE_SIZE, count - page_offset)
+                         for page_offset, data in zip(offsets, pages))
+        if short_page:
+            print("    Server returned short pages; refetching one page at a time")
+        else:
+            for data in pages:
+                all_features.extend(data.get('features', []))
+            print(f"    Got {len(all_features)} features from {len(pages)} pages")
+
+            # Only keep paging if the count was stale and more features follow
+            last = pages[-1]
+            if not exceeded_transfer_limit(last, last.get('features', [])):
+                return all_features
+            offset = offsets[-1] + len(last.get('features', []))
 
+    while True:
+        data = fetch_page(url, offset, timeout)
         features = data.get('features', [])
 
         if not features:
@@ -72,15 +165,84 @@ def fetch_with_pagination(url: str, timeout: int = 60) -> list:
         all_features.extend(features)
         print(f"    Got {len(features)} features (total: {len(all_features)})")
 
-        # If we got fewer than PAGE_SIZE, we've reached the end
-        if len(features) < PAGE_SIZE:
+        if not exceeded_transfer_limit(data, features):
             break
 
-        offset += PAGE_SIZE
+        # Advance by what was returned; the server may cap pages below PAGE_SIZE
+        offset += len(features)
 
     return all_features
 
 
+def geometry_bbox(geometry: dict) -> list:
+    """
+    Compute a GeoJSON bounding box for a geometry.
+
+    Args:
+        geometry: GeoJSON geometry (Point, Polygon, MultiPolygon, ...)
+
+    Returns:
+        list: [min_lng, min_lat, max_lng, max_lat], or [] if it has no coordinates
+    """
+    stack = [geometry.get('coordinates') or []]
+    xs = []
+    ys = []
+    while stack:
+        coords = stack.pop()
+        if coords and isinstance(coords[0], (int, float)):
+            xs.append(coords[0])
+            ys.append(coords[1])
+        else:
+            stack.extend(coords)
+
+    if not xs:
+        return []
+    return [min(xs), min(ys), max(xs), max(ys)]
+
+
+def add_bboxes(geojson_data: dict) -> None:
+    """
+    Add RFC 7946 "bbox" members to each feature and to the collection.
+
+    Consumers can reject features with a cheap box test before doing any
+    point-in-polygon work.
+    """
+    boxes = []
+    for feature in geojson_data.get('features', []):
+        bbox = geometry_bbox(feature.get('geometry') or {})
+        if bbox:
+            feature['bbox'] = bbox
+            boxes.append(bbox)
+
+    if boxes:
+        geojson_data['bbox'] = [
+            min(b[0] for b in boxes),
+            min(b[1] for b in boxes),
+            max(b[2] for b in boxes),
+            max(b[3] for b in boxes),
+        ]
+
+
+def write_if_changed(destination: Path, payload: bytes) -> bool:
+    """
+    Write payload to destination unless the file already holds it.
+
+    Leaving an identical file alone keeps its mtime stable for anything
+    that caches on it.
+
+    Returns:
+        bool: True if the file was written, False if it was unchanged
+    """
+    if (destination.exists()
+            and destination.stat().st_size == len(payload)
+            and destination.read_bytes() == payload):
+        return False
+
+    with open(destination, 'wb') as f:
+        f.write(payload)
+    return True
+
+
 def download_fire_boxes(force: bool = False) -> bool:
     """
     Download Montgomery County fire box boundaries.
@@ -134,7 +296,7 @@ def download_fire_boxes(force: bool = False) -> bool:
         try:
             response = requests.get(FIRE_BOX_GEOJSON_URL, timeout=120, allow_redirects=True)
             response.raise_for_status()
-            geojson_data = response.json()
+            geojson_data = parse_json(response)
 
             if geojson_data.get('type') != 'FeatureCollection':
                 raise ValueError("Invalid GeoJSON structure")
@@ -183,14 +345,20 @@ def download_fire_boxes(force: bool = False) -> bool:
 
         # Use only valid features
         geojson_data['features'] = valid_features
-
-        # Save to file
-        with open(destination, 'w', encoding='utf-8') as f:
-            json.dump(geojson_data, f, indent=2)
-
-        # Success
-        print(f"\n✓ Saved {len(valid_features)} fire boxes")
-        print(f"  File size: {destination.stat().st_size / 1024:.1f} KB")
+        add_bboxes(geojson_data)
+
+        # Save compact JSON plus a gzipped copy, skipping writes if nothing changed.
+        # mtime=0 keeps the gzip bytes deterministic for the unchanged check.
+        payload = json.dumps(geojson_data, separators=(',', ':')).encode('utf-8')
+        gz_destination = destination.with_name(destination.name + '.gz')
+        written = write_if_changed(destination, payload)
+        written |= write_if_changed(gz_destination, gzip.compress(payload, compresslevel=6, mtime=0))
+        if written:
+            print(f"\n✓ Saved {len(valid_features)} fire boxes")
+        else:
+            print(f"\n✓ Fire boxes unchanged ({len(valid_features)} features)")
+        print(f"  File size: {destination.stat().st_size / 1024:.1f} KB"
+              f" ({gz_destination.stat().st_size / 1024:.1f} KB gzipped)")
         print(f"  Location: {destination}")
 
         # Show sample attributes
@@ -2,13 +2,27 @@
 Automated Map Tile Downloader
 Downloads Maryland OpenMapTiles for offline use
 """
+import importlib.util
 import os
+import subprocess
 import sys
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from tqdm import tqdm
+from typing import Optional
 import hashlib
 
+# Install tqdm if not available (must happen before it is imported below)
+if importlib.util.find_spec("tqdm") is None:
+    print("Installing required package: tqdm")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "--quiet", "tqdm"])
+
+from tqdm import tqdm
+
 
 # Planetiler for tile generation
 PLANETILER_SOURCE = {
@@ -16,7 +30,8 @@ PLANETILER_SOURCE = {
     "version": "latest",
     "url": "https://github.com/onthegomap/planetiler/releases/latest/download/planetiler.jar",
     "filename": "planetiler.jar",
-    "description": "Tile generator (converts OSM to MBTiles)"
+    "description": "Tile generator (converts OSM to MBTiles)",
+    "sha256": None  # "latest" changes with each release, so there is no fixed digest
 }
 
 # OSM data for routing
@@ -24,59 +39,182 @@ MARYLAND_OSM_SOURCE = {
     "name": "Maryland OSM PBF",
     "url": "https://download.geofabrik.de/north-america/us/maryland-latest.osm.pbf",
     "filename": "maryland-latest.osm.pbf",
-    "description": "OpenStreetMap data for Maryland (for routing)"
+    "description": "OpenStreetMap data for Maryland (for routing)",
+    "sha256": None  # Rebuilt daily by Geofabrik
 }
 
 
+def create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all downloads.
+
+    Pooled connections let repeat hosts (GitHub serves both Planetiler and
+    GraphHopper) reuse TCP/TLS setup, and transient gateway errors are
+    retried with backoff.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+SESSION = create_session()
+
+
+def print_block(*lines: str) -> None:
+    """
+    Print a multi-line status block with a single write.
+
+    Goes through tqdm.write so the block doesn't tear any progress bar
+    that is currently drawing.
+    """
+    tqdm.write("\n".join(lines))
+
+
+@lru_cache(maxsize=1)
 def get_project_root():
-    """Get the project root directory"""
-    return Path(__file__).parent.parent
+    """Get the project root directory (resolved once, so cwd= and paths stay stable)"""
+    return Path(__file__).resolve().parent.parent
 
 
-def download_file(url: str, destination: Path, description: str = "") -> bool:
+def download_file(
+    url: str,
+    destination: Path,
+    description: str = "",
+    expected_sha256: Optional[str] = None
+) -> bool:
     """
     Download a file with progress bar.
 
+    Data is streamed to a ``.part`` file next to the destination, which is
+    renamed into place once complete. If a ``.part`` file is left over from
+    an interrupted run, the download resumes from where it stopped.
+
     Args:
         url: URL to download from
         destination: Path to save file
         description: Description for progress bar
+        expected_sha256: If given, the SHA-256 hex digest the file must match
 
     Returns:
         bool: True if successful, False otherwise
     """
     try:
-        print(f"\nDownloading: {description or url}")
-        print(f"Destination: {destination}")
+        print_block(
+            f"\nDownloading: {description or url}",
+            f"Destination: {destination}"
+        )
 
         # Create directory if it doesn't exist
         destination.parent.mkdir(parents=True, exist_ok=True)
 
-        # Stream download with progress bar
-        response = requests.get(url, stream=True, timeout=30)
+        part_file = destination.with_name(destination.name + ".part")
+
+        # A .part left by download_file_ranged is presized rather than a prefix
+        # of the file, so it can't be resumed by appending; start over
+        ranges_file = destination.with_name(destination.name + ".part.ranges")
+        if ranges_file.exists():
+            part_file.unlink(missing_ok=True)
+            ranges_file.unlink()
+
+        existing = part_file.stat().st_size if part_file.exists() else 0
+
+        # Stream download with progress bar. Ask for the bytes as stored so
+        # Content-Length and resume offsets both count what lands on disk.
+        headers = {'Accept-Encoding': 'identity'}
+        if existing:
+            headers['Range'] = f'bytes={existing}-'
+        response = SESSION.get(url, headers=headers, stream=True, timeout=30)
+
+        if existing and response.status_code == 416:
+            # Stale or oversized partial file - start over
+            response.close()
+            part_file.unlink()
+            existing = 0
+            response = SESSION.get(url, headers={'Accept-Encoding': 'identity'}, stream=True, timeout=30)
+
         response.raise_for_status()
 
-        total_size = int(response.headers.get('content-length', 0))
-        block_size = 8192
+        if existing and response.status_code == 206:
+            print(f"  Resuming from {existing / (1024*1024):.1f} MB")
+            mode = 'ab'
+        else:
+            # Server sent the whole file (or nothing to resume)
+            existing = 0
+            mode = 'wb'
+
+        # If a server compresses anyway, Content-Length counts encoded bytes and
+        # cannot be compared with the decoded file, so the size is treated as unknown
+        total_size = 0
+        if response.headers.get('content-encoding', 'identity').lower() in ('', 'identity'):
+            total_size = int(response.headers.get('content-length', 0))
+        if total_size:
+            total_size += existing
+        block_size = 1 << 20  # 1 MiB reads keep per-chunk Python overhead negligible
+        progress_step = 256 * 1024  # Minimum bytes between progress bar updates
+
+        # Hash while streaming; a resumed download hashes the bytes already on disk first
+        digest = None
+        if expected_sha256:
+            digest = hashlib.sha256()
+            if existing:
+                with open(part_file, 'rb') as f:
+                    while chunk := f.read(block_size):
+                        digest.update(chunk)
 
         # Import tqdm properly
         from tqdm.auto import tqdm as progress_bar
 
-        with open(destination, 'wb') as f, progress_bar(
+        with open(part_file, mode) as f, progress_bar(
             total=total_size,
+            initial=existing,
             unit='B',
             unit_scale=True,
             unit_divisor=1024,
             desc=description or destination.name,
-            ascii=True
+            ascii=True,
+            mininterval=0.5,  # Redraw at most twice a second
+            maxinterval=2.0,
+            smoothing=0.1
         ) as pbar:
-            for chunk in response.iter_content(chunk_size=block_size):
-                if chunk:
-                    f.write(chunk)
-                    pbar.update(len(chunk))
+            # Read straight from the urllib3 stream rather than iter_content's generator
+            response.raw.decode_content = True
+            read = response.raw.read
+            pending = 0
+            while True:
+                chunk = read(block_size)
+                if not chunk:
+                    break
+                f.write(chunk)
+                if digest:
+                    digest.update(chunk)
+                pending += len(chunk)
+                if pending >= progress_step:
+                    pbar.update(pending)
+                    pending = 0
+            if pending:
+                pbar.update(pending)
+
+        if total_size and part_file.stat().st_size != total_size:
+            print(f"✗ Download incomplete: {destination.name} (run again to resume)")
+            return False
 
-        print(f"✓ Downloaded successfully: {destination.name}")
-        print(f"  Size: {destination.stat().st_size / (1024*1024):.1f} MB")
+        if digest and digest.hexdigest() != expected_sha256.lower():
+            print(f"✗ Checksum mismatch: {destination.name}")
+            part_file.unlink()
+            return False
+
+        part_file.replace(destination)
+
+        print_block(
+            f"✓ Downloaded successfully: {destination.name}",
+            f"  Size: {destination.stat().st_size / (1024*1024):.1f} MB"
+        )
         return True
 
     except requests.exceptions.RequestException as e:
@@ -87,29 +225,254 @@ def download_file(url: str, destination: Path, description: str = "") -> bool:
         return False
 
 
+def download_file_ranged(
+    url: str,
+    destination: Path,
+    description: str = "",
+    n_conns: int = 4,
+    part_size: int = 32 * 1024 * 1024,
+    expected_sha256: Optional[str] = None
+) -> bool:
+    """
+    Download a large file over several connections using HTTP Range requests.
+
+    Falls back to download_file() when the server does not advertise
+    byte-range support or the file is smaller than a single part.
+
+    Ranges are written into a presized ``.part`` file that is only renamed
+    onto the destination once every range has arrived in full, so a
+    half-filled file can never be mistaken for a finished download. Each
+    finished range is recorded in a ``.part.ranges`` sidecar; after a
+    failure or Ctrl+C both are kept and the next run fetches only the
+    ranges that are still missing.
+
+    Args:
+        url: URL to download from
+        destination: Path to save file
+        description: Description for progress bar
+        n_conns: Number of concurrent connections
+        part_size: Bytes fetched per range request
+        expected_sha256: If given, the SHA-256 hex digest the file must match
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        head = SESSION.head(url, allow_redirects=True, timeout=30)
+        head.raise_for_status()
+    except requests.exceptions.RequestException:
+        return download_file(url, destination, description, expected_sha256)
+
+    total_size = int(head.headers.get('content-length', 0))
+    if head.headers.get('accept-ranges', '').lower() != 'bytes' or total_size <= part_size:
+        return download_file(url, destination, description, expected_sha256)
+
+    # Ranges go to the final URL so GitHub's release redirect is only followed once
+    range_url = head.url
+    part_file = destination.with_name(destination.name + ".part")
+    ranges_file = destination.with_name(destination.name + ".part.ranges")
+    layout = f"{total_size} {part_size}"
+
+    try:
+        print_block(
+            f"\nDownloading: {description or url}",
+            f"Destination: {destination}",
+            f"  Using {n_conns} connections"
+        )
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        # The sidecar starts with the file/range sizes it was written for,
+        # followed by the start offset of every range that finished
+        done = set()
+        try:
+            recorded = ranges_file.read_text().split("\n")
+            if recorded[0] == layout and part_file.stat().st_size == total_size:
+                done = {int(line) for line in recorded[1:] if line.strip()}
+        except (OSError, ValueError):
+            done = set()
+
+        if done:
+            print(f"  Resuming: {len(done)} of {-(-total_size // part_size)} ranges already downloaded")
+        else:
+            # Size the file up front so each worker can write its range in place.
+            # fallocate reserves the blocks in one go; truncate leaves a sparse file.
+            with open(part_file, 'wb') as f:
+                try:
+                    os.posix_fallocate(f.fileno(), 0, total_size)
+                except (AttributeError, OSError):
+                    f.truncate(total_size)
+            ranges_file.write_text(layout + "\n")
+
+        pending = [start for start in range(0, total_size, part_size) if start not in done]
+        already = sum(min(start + part_size, total_size) - start for start in done)
+        record_lock = threading.Lock()
+
+        from tqdm.auto import tqdm as progress_bar
+
+        with progress_bar(
+            total=total_size,
+            initial=already,
+            unit='B',
+            unit_scale=True,
+            unit_divisor=1024,
+            desc=description or destination.name,
+            ascii=True,
+            mininterval=0.5,  # Redraw at most twice a second
+            maxinterval=2.0,
+            smoothing=0.1
+        ) as pbar:
+            def fetch_range(start: int) -> None:
+                end = min(start + part_size, total_size) - 1
+                response = SESSION.get(
+                    range_url,
+                    headers={'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'},
+                    stream=True,
+                    timeout=30
+                )
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise requests.exceptions.RequestException(
+                        f"Server ignored range request (HTTP {response.status_code})"
+                    )
+
+                read = response.raw.read
+                written = 0
+                with open(part_file, 'r+b') as f:
+                    f.seek(start)
+                    while True:
+                        chunk = read(1 << 20)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        written += len(chunk)
+                        pbar.update(len(chunk))
+
+                # The file is presized, so a short range would otherwise go unnoticed
+                if written != end - start + 1:
+                    raise requests.exceptions.RequestException(
+                        f"Range {start}-{end} returned {written} of {end - start + 1} bytes"
+                    )
+
+                # Only record the range once its bytes are written in full
+                with record_lock, open(ranges_file, 'a') as f:
+                    f.write(f"{start}\n")
+
+            with ThreadPoolExecutor(max_workers=n_conns) as pool:
+                list(pool.map(fetch_range, pending))
+
+        # Ranges arrive out of order, so the checksum is taken over the finished file
+        if expected_sha256:
+            digest = hashlib.sha256()
+            with open(part_file, 'rb') as f:
+                while chunk := f.read(1 << 20):
+                    digest.update(chunk)
+            if digest.hexdigest() != expected_sha256.lower():
+                print(f"✗ Checksum mismatch: {destination.name}")
+                part_file.unlink(missing_ok=True)
+                ranges_file.unlink(missing_ok=True)
+                return False
+
+        os.replace(part_file, destination)
+        ranges_file.unlink(missing_ok=True)
+
+        print_block(
+            f"✓ Downloaded successfully: {destination.name}",
+            f"  Size: {destination.stat().st_size / (1024*1024):.1f} MB"
+        )
+        return True
+
+    except requests.exceptions.RequestException as e:
+        print(f"✗ Download failed: {e} (run again to resume)")
+        return False
+    except Exception as e:
+        print(f"✗ Unexpected error: {e} (run again to resume)")
+        return False
+
+
+def check_cached(destination: Path, label: str, force: bool) -> bool:
+    """
+    Report an already-downloaded file and tell the caller to skip it.
+
+    Args:
+        destination: Expected download location
+        label: Human-readable name for messages
+        force: If True, never treat the file as cached
+
+    Returns:
+        bool: True if the file exists and the download can be skipped
+    """
+    if force:
+        return False
+    try:
+        size = destination.stat().st_size
+    except FileNotFoundError:
+        return False
+
+    print_block(
+        f"\n✓ {label} already exists: {destination}",
+        f"  Size: {size / (1024*1024):.1f} MB",
+        "  Use --force to re-download"
+    )
+    return True
+
+
 def verify_mbtiles(file_path: Path) -> bool:
     """
     Verify that an MBTiles file is valid SQLite database.
 
+    Besides checking for the tiles table, runs SQLite's quick_check (with
+    memory-mapped I/O) and counts tiles so truncated or corrupt files
+    generated by an interrupted run are caught.
+
     Args:
         file_path: Path to MBTiles file
 
     Returns:
         bool: True if valid, False otherwise
     """
+    import sqlite3
+
+    # Cheap first pass: anything without the SQLite header (e.g. an HTML
+    # error page saved as .mbtiles) fails before a connection is opened
     try:
-        import sqlite3
-        conn = sqlite3.connect(str(file_path))
-        cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='tiles'")
-        result = cursor.fetchone()
-        conn.close()
-
-        if result:
-            print(f"✓ Verified: {file_path.name} is a valid MBTiles file")
-            return True
-        else:
-            print(f"✗ Invalid: {file_path.name} is not a valid MBTiles file")
-            return False
+        with open(file_path, 'rb') as f:
+            magic = f.read(16)
+    except OSError as e:
+        print(f"✗ Verification failed: {e}")
+        return False
+    if magic != b"SQLite format 3\x00":
+        print(f"✗ Invalid: {file_path.name} is not a SQLite database")
+        return False
+
+    try:
+        conn = sqlite3.connect(f"{file_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+
+            cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='tiles'")
+            if not cursor.fetchone():
+                print(f"✗ Invalid: {file_path.name} is not a valid MBTiles file")
+                return False
+
+            check = conn.execute("PRAGMA quick_check").fetchone()[0]
+            if check != "ok":
+                print(f"✗ Corrupt: {file_path.name} failed integrity check ({check})")
+                return False
+
+            tile_count = conn.execute("SELECT count(*) FROM tiles").fetchone()[0]
+            if not tile_count:
+                print(f"✗ Invalid: {file_path.name} contains no tiles")
+                return False
+        finally:
+            conn.close()
+
+        print(f"✓ Verified: {file_path.name} is a valid MBTiles file ({tile_count:,} tiles)")
+        return True
+
+    except sqlite3.DatabaseError as e:
+        print(f"✗ Corrupt: {file_path.name} is not a readable SQLite database ({e})")
+        return False
     except Exception as e:
         print(f"✗ Verification failed: {e}")
         return False
@@ -132,20 +495,21 @@ def download_planetiler(force: bool = False) -> bool:
     destination = tools_dir / PLANETILER_SOURCE["filename"]
 
     # Check if already downloaded
-    if destination.exists() and not force:
-        print(f"\n✓ Planetiler already exists: {destination}")
-        print(f"  Size: {destination.stat().st_size / (1024*1024):.1f} MB")
+    if check_cached(destination, "Planetiler", force):
         return True
 
     # Download
-    print("\n" + "="*60)
-    print("DOWNLOADING PLANETILER TILE GENERATOR")
-    print("="*60)
+    print_block(
+        "\n" + "="*60,
+        "DOWNLOADING PLANETILER TILE GENERATOR",
+        "="*60
+    )
 
-    success = download_file(
+    success = download_file_ranged(
         PLANETILER_SOURCE["url"],
         destination,
-        PLANETILER_SOURCE["description"]
+        PLANETILER_SOURCE["description"],
+        expected_sha256=PLANETILER_SOURCE["sha256"]
     )
 
     if success:
@@ -156,6 +520,125 @@ def download_planetiler(force: bool = False) -> bool:
         return False
 
 
+def get_available_memory_gb() -> Optional[int]:
+    """
+    Get the currently available physical memory in whole GB.
+
+    Returns:
+        int or None: Available memory, or None if it can't be determined
+    """
+    try:
+        if sys.platform == "win32":
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return None
+            available = status.ullAvailPhys
+        else:
+            available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+    return available // (1 << 30)
+
+
+def get_planetiler_heap_gb() -> int:
+    """
+    Size the Planetiler heap from available RAM.
+
+    Leaves 2 GB for the OS and clamps to 2-12 GB; falls back to 4 GB when
+    available memory can't be read.
+    """
+    available_gb = get_available_memory_gb()
+    if available_gb is None:
+        return 4
+    return max(2, min(12, available_gb - 2))
+
+
+def run_with_watchdog(command: list, cwd: Path, timeout: float, stall_timeout: float) -> int:
+    """
+    Run a command, echoing its output live, and kill it if it hangs.
+
+    Output is read through a pipe on a background thread so the caller can
+    notice when the process goes quiet (e.g. a stalled download inside
+    Planetiler) long before the overall timeout.
+
+    Args:
+        command: Command and arguments
+        cwd: Working directory
+        timeout: Maximum total runtime in seconds
+        stall_timeout: Maximum seconds without any output
+
+    Returns:
+        int: Process exit code
+
+    Raises:
+        subprocess.TimeoutExpired: If either limit is exceeded
+    """
+    import queue
+    import threading
+    import time
+
+    process = subprocess.Popen(
+        command,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+
+    lines = queue.Queue()
+
+    def pump():
+        for line in process.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    threading.Thread(target=pump, daemon=True).start()
+
+    started = last_output = time.monotonic()
+    try:
+        while True:
+            now = time.monotonic()
+            if now - started > timeout:
+                raise subprocess.TimeoutExpired(command, timeout)
+            if now - last_output > stall_timeout:
+                print(f"\n✗ No output for {stall_timeout / 60:.0f} minutes, stopping process", flush=True)
+                raise subprocess.TimeoutExpired(command, stall_timeout)
+
+            try:
+                line = lines.get(timeout=1)
+            except queue.Empty:
+                continue
+
+            if line is None:
+                break
+            last_output = time.monotonic()
+            print(line, end="", flush=True)
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+
+    return process.wait()
+
+
 def generate_maryland_tiles(force: bool = False) -> bool:
     """
     Generate Maryland map tiles from OSM data using Planetiler.
@@ -166,7 +649,6 @@ def generate_maryland_tiles(force: bool = False) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    import subprocess
     import shutil
 
     project_root = get_project_root()
@@ -177,9 +659,11 @@ def generate_maryland_tiles(force: bool = False) -> bool:
 
     # Check if already generated
     if destination.exists() and not force:
-        print(f"\n✓ Tiles already exist: {destination}")
-        print(f"  Size: {destination.stat().st_size / (1024*1024):.1f} MB")
-        print("  Use --force to regenerate")
+        print_block(
+            f"\n✓ Tiles already exist: {destination}",
+            f"  Size: {destination.stat().st_size / (1024*1024):.1f} MB",
+            "  Use --force to regenerate"
+        )
 
         # Verify the existing file
         if verify_mbtiles(destination):
@@ -196,39 +680,39 @@ def generate_maryland_tiles(force: bool = False) -> bool:
 
     osm_file = project_root / "routing" / "graphhopper" / MARYLAND_OSM_SOURCE["filename"]
     if not osm_file.exists():
-        print("\n✗ OSM data not found. Please download first.")
-        print(f"  Run: python scripts/download_tiles.py --osm-only")
+        print_block(
+            "\n✗ OSM data not found. Please download first.",
+            f"  Run: python scripts/download_tiles.py --osm-only"
+        )
         return False
 
-    # Check Java
-    try:
-        result = subprocess.run(
-            ["java", "-version"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode != 0:
-            print("\n✗ Java not found. Please install Java 21+ from: https://adoptium.net/")
-            return False
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    # Check Java (a PATH lookup; starting a JVM just to print its version is slow)
+    java_path = shutil.which("java")
+    if not java_path:
         print("\n✗ Java not found. Please install Java 21+ from: https://adoptium.net/")
         return False
 
     # Generate tiles
-    print("\n" + "="*60)
-    print("GENERATING MARYLAND MAP TILES")
-    print("="*60)
-    print("\n⚠️  IMPORTANT: Tile generation takes 5-15 minutes")
-    print("This is a ONE-TIME process. Subsequent runs will be instant.\n")
-    print(f"Input:  {osm_file} ({osm_file.stat().st_size / (1024*1024):.1f} MB)")
-    print(f"Output: {destination}")
-    print("\nProcessing...")
+    print_block(
+        "\n" + "="*60,
+        "GENERATING MARYLAND MAP TILES",
+        "="*60,
+        "\n⚠️  IMPORTANT: Tile generation takes 5-15 minutes",
+        "This is a ONE-TIME process. Subsequent runs will be instant.\n",
+        f"Input:  {osm_file} ({osm_file.stat().st_size / (1024*1024):.1f} MB)",
+        f"Output: {destination}",
+        "\nProcessing..."
+    )
 
     # Planetiler command with FASTER download settings
+    heap_gb = get_planetiler_heap_gb()
+    print(f"Java heap: {heap_gb} GB")
+
     command = [
-        "java",
-        "-Xmx4g",  # 4GB heap
+        java_path,
+        f"-Xmx{heap_gb}g",  # Sized from available RAM
+        "-XX:+UseG1GC",
+        "-XX:+AlwaysPreTouch",  # Commit heap pages up front rather than mid-run
         "-jar", str(planetiler_jar),
         "--download",  # Download natural earth & water data
         "--area=maryland",
@@ -237,42 +721,47 @@ def generate_maryland_tiles(force: bool = False) -> bool:
         "--maxzoom=14",
         "--minzoom=0",
         # FASTER DOWNLOAD SETTINGS (with correct ISO-8601 duration format)
-        "--download-threads=4",  # Parallel downloads (default: 1)
+        "--download-threads=8",  # Parallel downloads (default: 1)
         "--download-chunk-size-mb=500",  # Larger chunks (default: 100)
         "--http-retries=3",  # Fewer retries (default: 5)
-        "--http-timeout=PT60S"  # 60 seconds timeout (ISO-8601 format)
+        "--http-timeout=PT60S",  # 60 seconds timeout (ISO-8601 format)
+        # LOWER MEMORY SETTINGS (node map lives in the OS page cache, not the heap)
+        "--nodemap-storage=mmap",
+        "--nodemap-madvise",
+        "--free-osm-after-read"
     ]
 
     try:
         # Run Planetiler
         print("\nRunning Planetiler (this will take several minutes)...\n")
-        result = subprocess.run(
+        returncode = run_with_watchdog(
             command,
             cwd=project_root,
-            capture_output=False,  # Show output in real-time
-            text=True,
-            timeout=1800  # 30 minute timeout
+            timeout=1800,  # 30 minute timeout
+            stall_timeout=300  # Give up after 5 minutes without output
         )
 
-        if result.returncode == 0 and destination.exists():
+        if returncode == 0 and destination.exists():
             # Verify generated file
             if verify_mbtiles(destination):
-                print("\n" + "="*60)
-                print("✓ TILE GENERATION COMPLETE!")
-                print("="*60)
-                print(f"  Output: {destination}")
-                print(f"  Size: {destination.stat().st_size / (1024*1024):.1f} MB")
-                print("\n✓ Maryland tiles ready for offline use!")
+                print_block(
+                    "\n" + "="*60,
+                    "✓ TILE GENERATION COMPLETE!",
+                    "="*60,
+                    f"  Output: {destination}",
+                    f"  Size: {destination.stat().st_size / (1024*1024):.1f} MB",
+                    "\n✓ Maryland tiles ready for offline use!"
+                )
                 return True
             else:
                 print("\n✗ Generated file is invalid")
                 return False
         else:
-            print(f"\n✗ Tile generation failed (exit code: {result.returncode})")
+            print(f"\n✗ Tile generation failed (exit code: {returncode})")
             return False
 
-    except subprocess.TimeoutExpired:
-        print("\n✗ Tile generation timed out (>30 minutes)")
+    except subprocess.TimeoutExpired as e:
+        print(f"\n✗ Tile generation timed out (>{e.timeout / 60:.0f} minutes)")
         return False
     except Exception as e:
         print(f"\n✗ Unexpected error during generation: {e}")
@@ -296,21 +785,21 @@ def download_maryland_osm(force: bool = False) -> bool:
     destination = routing_dir / MARYLAND_OSM_SOURCE["filename"]
 
     # Check if already downloaded
-    if destination.exists() and not force:
-        print(f"\n✓ OSM data already exists: {destination}")
-        print(f"  Size: {destination.stat().st_size / (1024*1024):.1f} MB")
-        print("  Use --force to re-download")
+    if check_cached(destination, "OSM data", force):
         return True
 
     # Download
-    print("\n" + "="*60)
-    print("DOWNLOADING MARYLAND OSM DATA (for routing)")
-    print("="*60)
+    print_block(
+        "\n" + "="*60,
+        "DOWNLOADING MARYLAND OSM DATA (for routing)",
+        "="*60
+    )
 
-    success = download_file(
+    success = download_file_ranged(
         MARYLAND_OSM_SOURCE["url"],
         destination,
-        MARYLAND_OSM_SOURCE["description"]
+        MARYLAND_OSM_SOURCE["description"],
+        expected_sha256=MARYLAND_OSM_SOURCE["sha256"]
     )
 
     if success:
@@ -341,15 +830,15 @@ def download_graphhopper_jar(force: bool = False) -> bool:
     destination = routing_dir / jar_filename
 
     # Check if already downloaded
-    if destination.exists() and not force:
-        print(f"\n✓ GraphHopper JAR already exists: {destination}")
-        print(f"  Size: {destination.stat().st_size / (1024*1024):.1f} MB")
+    if check_cached(destination, "GraphHopper JAR", force):
         return True
 
     # Download
-    print("\n" + "="*60)
-    print("DOWNLOADING GRAPHHOPPER ROUTING ENGINE")
-    print("="*60)
+    print_block(
+        "\n" + "="*60,
+        "DOWNLOADING GRAPHHOPPER ROUTING ENGINE",
+        "="*60
+    )
 
     url = f"https://github.com/graphhopper/graphhopper/releases/download/{GH_VERSION}/{jar_filename}"
 
@@ -363,11 +852,13 @@ def download_graphhopper_jar(force: bool = False) -> bool:
         print("\n✓ GraphHopper ready!")
         return True
     else:
-        print("\n✗ Failed to download GraphHopper")
-        print("\nManual download instructions:")
-        print(f"1. Visit: https://github.com/graphhopper/graphhopper/releases")
-        print(f"2. Download: graphhopper-web-{GH_VERSION}.jar")
-        print(f"3. Save to: {destination}")
+        print_block(
+            "\n✗ Failed to download GraphHopper",
+            "\nManual download instructions:",
+            f"1. Visit: https://github.com/graphhopper/graphhopper/releases",
+            f"2. Download: graphhopper-web-{GH_VERSION}.jar",
+            f"3. Save to: {destination}"
+        )
         return False
 
 
@@ -381,62 +872,78 @@ def download_all(force: bool = False) -> bool:
     Returns:
         bool: True if all downloads successful
     """
-    print("\n" + "="*60)
-    print("MOCO EMS TRAINER - OFFLINE DATA SETUP")
-    print("="*60)
-    print("\nThis will:")
-    print("  1. Download Maryland OSM Data (~200 MB)")
-    print("  2. Download GraphHopper Routing Engine (~45 MB)")
-    print("  3. Download Planetiler Tile Generator (~90 MB)")
-    print("  4. Generate offline map tiles (10-20 minutes)")
-    print("     - Includes water features & natural earth data")
-    print("\nTotal download size: ~1.5 GB (one-time)")
-    print("Generated tiles: ~300-600 MB")
-    print("="*60)
-
-    # Step 1: Download prerequisites
-    results = {
-        "osm": download_maryland_osm(force),
-        "graphhopper": download_graphhopper_jar(force),
-        "planetiler": download_planetiler(force)
-    }
+    print_block(
+        "\n" + "="*60,
+        "MOCO EMS TRAINER - OFFLINE DATA SETUP",
+        "="*60,
+        "\nThis will:",
+        "  1. Download Maryland OSM Data (~200 MB)",
+        "  2. Download GraphHopper Routing Engine (~45 MB)",
+        "  3. Download Planetiler Tile Generator (~90 MB)",
+        "  4. Generate offline map tiles (10-20 minutes)",
+        "     - Includes water features & natural earth data",
+        "\nTotal download size: ~1.5 GB (one-time)",
+        "Generated tiles: ~300-600 MB",
+        "="*60
+    )
 
-    print("\n" + "="*60)
-    print("DOWNLOAD SUMMARY")
-    print("="*60)
-    print(f"  OSM Data:     {'✓ Success' if results['osm'] else '✗ Failed'}")
-    print(f"  GraphHopper:  {'✓ Success' if results['graphhopper'] else '✗ Failed'}")
-    print(f"  Planetiler:   {'✓ Success' if results['planetiler'] else '✗ Failed'}")
-    print("="*60)
+    # Step 1: Download prerequisites (independent files, fetched concurrently;
+    # tqdm stacks the progress bars automatically)
+    downloads = {
+        "osm": download_maryland_osm,
+        "graphhopper": download_graphhopper_jar,
+        "planetiler": download_planetiler
+    }
+    with ThreadPoolExecutor(max_workers=len(downloads)) as pool:
+        futures = {name: pool.submit(func, force) for name, func in downloads.items()}
+    results = {name: future.result() for name, future in futures.items()}
+
+    print_block(
+        "\n" + "="*60,
+        "DOWNLOAD SUMMARY",
+        "="*60,
+        f"  OSM Data:     {'✓ Success' if results['osm'] else '✗ Failed'}",
+        f"  GraphHopper:  {'✓ Success' if results['graphhopper'] else '✗ Failed'}",
+        f"  Planetiler:   {'✓ Success' if results['planetiler'] else '✗ Failed'}",
+        "="*60
+    )
 
     if not all(results.values()):
         print("\n✗ Some downloads failed. Please check errors above.")
         return False
 
     # Step 2: Generate tiles
-    print("\n" + "="*60)
-    print("STEP 2: TILE GENERATION")
-    print("="*60)
+    print_block(
+        "\n" + "="*60,
+        "STEP 2: TILE GENERATION",
+        "="*60
+    )
 
     tiles_success = generate_maryland_tiles(force)
 
-    print("\n" + "="*60)
-    print("FINAL SUMMARY")
-    print("="*60)
-    print(f"  Downloads:       ✓ Success")
-    print(f"  Tile Generation: {'✓ Success' if tiles_success else '✗ Failed'}")
-    print("="*60)
+    print_block(
+        "\n" + "="*60,
+        "FINAL SUMMARY",
+        "="*60,
+        f"  Downloads:       ✓ Success",
+        f"  Tile Generation: {'✓ Success' if tiles_success else '✗ Failed'}",
+        "="*60
+    )
 
     if tiles_success:
-        print("\n✓ All setup complete! App is ready for 100% offline use.")
-        print("\nNext steps:")
-        print("  1. Run: .\\start-dev.ps1")
-        print("     (This starts all 4 services automatically)")
+        print_block(
+            "\n✓ All setup complete! App is ready for 100% offline use.",
+            "\nNext steps:",
+            "  1. Run: .\\start-dev.ps1",
+            "     (This starts all 4 services automatically)"
+        )
         return True
     else:
-        print("\n✗ Tile generation failed. Check errors above.")
-        print("\nYou can retry just tile generation with:")
-        print("  python scripts/download_tiles.py --tiles-only")
+        print_block(
+            "\n✗ Tile generation failed. Check errors above.",
+            "\nYou can retry just tile generation with:",
+            "  python scripts/download_tiles.py --tiles-only"
+        )
         return False
 
 
@@ -451,14 +958,6 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    # Install tqdm if not available
-    try:
-        import tqdm
-    except ImportError:
-        print("Installing required package: tqdm")
-        os.system(f"{sys.executable} -m pip install tqdm")
-        import tqdm
-
     # Run specific download or all
     if args.tiles_only:
         generate_maryland_tiles(args.force)
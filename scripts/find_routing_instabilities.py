@@ -12,20 +12,43 @@ Usage:
 
 import argparse
 import json
-import math
+import sqlite3
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from scipy.spatial import KDTree
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / "data"
 GIS_DIR = DATA_DIR / "gis"
 
+# Routes are cached across runs; bump the version when the stored format changes
+ROUTE_CACHE_FILE = DATA_DIR / "route_cache.sqlite"
+ROUTE_CACHE_VERSION = 1
+OSM_EXTRACT = SCRIPT_DIR.parent / "routing" / "graphhopper" / "maryland-latest.osm.pbf"
+
+EARTH_RADIUS_M = 6371000  # Earth's radius in meters
+
+# Approximate meters per degree at 39°N, for planar (KD-tree) distances
+LAT_SCALE = 111000
+LNG_SCALE = 85000
+
+# Route points are resampled to roughly this spacing for overlap checks
+ROUTE_SAMPLE_SPACING_M = 20
+
 
 @dataclass
 class RouteSignature:
@@ -36,12 +59,15 @@ class RouteSignature:
     initial_bearing: float  # Bearing leaving the station (0-360)
     first_road: str  # Name of first road after leaving station
     route_roads: list  # List of road names in order
-    route_geometry: list  # Full route coordinates
     total_distance: float  # meters
     total_duration: float  # seconds
     has_uturn: bool  # Route contains U-turn
     success: bool
     error: Optional[str] = None
+    route_xy: Optional[np.ndarray] = field(default=None, repr=False)  # (N, 2) float64 lng/lat, resampled
+    scaled_xy: Optional[np.ndarray] = field(default=None, repr=False)  # route_xy in approximate meters
+    route_tree: Optional[KDTree] = field(default=None, repr=False)  # KD-tree over scaled_xy
+    bbox: Optional[np.ndarray] = field(default=None, repr=False)  # (min_x, min_y, max_x, max_y) of scaled_xy
 
 
 @dataclass
@@ -57,6 +83,43 @@ class InstabilityZone:
     reason: str  # Why this was flagged
 
 
+def create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all routing threads.
+
+    The pool is sized above the default --workers so every thread keeps its
+    own keep-alive connection to the routing server instead of reconnecting
+    per request.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+SESSION = create_session()
+
+
+def load_json(path: Path):
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def parse_json(response: requests.Response):
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 def load_addresses(station_pattern: str) -> list[dict]:
     """Load addresses for a station's first-due area."""
     # Try station-specific file first (check both gis/ and data/ directories)
@@ -64,40 +127,66 @@ def load_addresses(station_pattern: str) -> list[dict]:
         station_file = base_dir / f"addresses_station_{station_pattern}.geojson"
         if station_file.exists():
             print(f"Loading addresses from {station_file}")
-            with open(station_file) as f:
-                data = json.load(f)
-                return data.get("features", [])
+            data = load_json(station_file)
+            return data.get("features", [])
 
     # Fall back to general addresses file and filter
     for base_dir in [GIS_DIR, DATA_DIR]:
         general_file = base_dir / "addresses.geojson"
         if general_file.exists():
             print(f"Loading addresses from {general_file} (filtering by station {station_pattern})")
-            with open(general_file) as f:
-                data = json.load(f)
-                features = data.get("features", [])
-                # Filter by beat pattern if available
-                filtered = [f for f in features if f.get("properties", {}).get("beat", "").startswith(station_pattern)]
-                if filtered:
-                    return filtered
-                return features  # Return all if no beat info
+            data = load_json(general_file)
+            features = data.get("features", [])
+            # Filter by beat pattern if available
+            filtered = [f for f in features if f.get("properties", {}).get("beat", "").startswith(station_pattern)]
+            if filtered:
+                return filtered
+            return features  # Return all if no beat info
 
     print(f"ERROR: No address data found. Run download_addresses.py first.")
     sys.exit(1)
 
 
+# Property names that may hold the street address, in order of preference
+ADDRESS_KEYS = ("address", "FULL_ADDRESS", "full_address")
+
+
+def prepare_address_records(addresses: list[dict]) -> list[tuple[str, str, tuple[float, float]]]:
+    """Extract (address_id, address, (lng, lat)) for every Point feature, in one pass."""
+    records = []
+    for i, feature in enumerate(addresses):
+        geom = feature.get("geometry") or {}
+        if geom.get("type") != "Point":
+            continue
+
+        coord = geom.get("coordinates") or ()
+        if len(coord) < 2:
+            continue
+
+        props = feature.get("properties") or {}
+        street_addr = next((props[key] for key in ADDRESS_KEYS if key in props), None)
+        if street_addr is None:
+            street_addr = f"Address {i}"
+        city = props.get("city")
+        address = f"{street_addr}, {city}" if city else street_addr
+        address_id = props["id"] if "id" in props else str(i)
+
+        records.append((address_id, address, (coord[0], coord[1])))
+
+    return records
+
+
 def get_station_location(station_pattern: str) -> tuple[float, float]:
     """Get the station's coordinates."""
     # Load stations data
     stations_file = DATA_DIR / "facilities" / "fire_stations.json"
     if stations_file.exists():
-        with open(stations_file) as f:
-            stations = json.load(f)
-            for station in stations:
-                # Match by station number
-                station_num = station.get("station_number", "")
-                if station_num.zfill(2) == station_pattern:
-                    return (station["longitude"], station["latitude"])
+        stations = load_json(stations_file)
+        for station in stations:
+            # Match by station number
+            station_num = station.get("station_number", "")
+            if station_num.zfill(2) == station_pattern:
+                return (station["longitude"], station["latitude"])
 
     # Hardcoded station locations (actual addresses)
     STATION_COORDS = {
@@ -111,34 +200,39 @@ def get_station_location(station_pattern: str) -> tuple[float, float]:
     return (-77.1528, 39.1434)
 
 
-def calculate_bearing(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """Calculate initial bearing from point 1 to point 2 in degrees (0-360)."""
-    lat1, lng1, lat2, lng2 = map(math.radians, [lat1, lng1, lat2, lng2])
+def compute_initial_bearings(segments: np.ndarray) -> np.ndarray:
+    """
+    Calculate initial bearings in degrees (0-360) for a batch of segments.
+    segments has shape (N, 2, 2): [[lng1, lat1], [lng2, lat2]] per row.
+    """
+    segments = np.radians(segments)
+    lng1, lat1 = segments[:, 0, 0], segments[:, 0, 1]
+    lng2, lat2 = segments[:, 1, 0], segments[:, 1, 1]
 
     d_lng = lng2 - lng1
-    x = math.sin(d_lng) * math.cos(lat2)
-    y = math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(d_lng)
-
-    bearing = math.atan2(x, y)
-    bearing = math.degrees(bearing)
-    bearing = (bearing + 360) % 360
+    x = np.sin(d_lng) * np.cos(lat2)
+    y = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(d_lng)
 
-    return bearing
+    return (np.degrees(np.arctan2(x, y)) + 360) % 360
 
 
-def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """Calculate distance between two points in meters."""
-    R = 6371000  # Earth's radius in meters
+def assign_initial_bearings(signatures: list[RouteSignature]):
+    """Fill in initial_bearing for every routed signature in one vectorized pass."""
+    routed = [s for s in signatures if s.success and len(s.route_xy) >= 2]
+    if not routed:
+        return
 
-    lat1, lng1, lat2, lng2 = map(math.radians, [lat1, lng1, lat2, lng2])
+    bearings = compute_initial_bearings(np.stack([s.route_xy[:2] for s in routed]))
+    for sig, bearing in zip(routed, bearings.tolist()):
+        sig.initial_bearing = bearing
 
-    dlat = lat2 - lat1
-    dlng = lng2 - lng1
 
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlng/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+def haversine_distances(lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray) -> np.ndarray:
+    """Haversine distance between arrays of points (degrees in, meters out)."""
+    lat1, lng1, lat2, lng2 = (np.radians(v) for v in (lat1, lng1, lat2, lng2))
 
-    return R * c
+    a = np.sin((lat2 - lat1) / 2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2)**2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
 
 
 def get_route_graphhopper(base_url: str, start: tuple[float, float], end: tuple[float, float]) -> Optional[dict]:
@@ -152,9 +246,9 @@ def get_route_graphhopper(base_url: str, start: tuple[float, float], end: tuple[
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = SESSION.get(url, params=params, timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             if data.get("paths"):
                 path = data["paths"][0]
                 # Convert to common format
@@ -184,9 +278,9 @@ def get_route_osrm(base_url: str, start: tuple[float, float], end: tuple[float,
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = SESSION.get(url, params=params, timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = parse_json(response)
             if data.get("code") == "Ok" and data.get("routes"):
                 return data["routes"][0]
     except Exception as e:
@@ -203,16 +297,58 @@ def get_route(base_url: str, start: tuple[float, float], end: tuple[float, float
         return get_route_osrm(base_url, start, end)
 
 
+class RouteCache:
+    """
+    SQLite-backed cache of normalized routes, keyed by engine, server and
+    endpoints rounded to ~1m. The OSM extract's mtime is part of the key, so
+    refreshing the map data invalidates old entries. Safe to share between
+    routing threads.
+    """
+
+    def __init__(self, path: Path, engine: str, base_url: str):
+        osm_stamp = OSM_EXTRACT.stat().st_mtime_ns if OSM_EXTRACT.exists() else 0
+        self.prefix = f"v{ROUTE_CACHE_VERSION}|{engine}|{base_url}|{osm_stamp}"
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS routes (key TEXT PRIMARY KEY, route TEXT NOT NULL)")
+        self.conn.commit()
+
+    def _key(self, start: tuple[float, float], end: tuple[float, float]) -> str:
+        return f"{self.prefix}|{start[0]:.5f},{start[1]:.5f}|{end[0]:.5f},{end[1]:.5f}"
+
+    def get(self, start: tuple[float, float], end: tuple[float, float]) -> Optional[dict]:
+        with self.lock:
+            row = self.conn.execute("SELECT route FROM routes WHERE key = ?", (self._key(start, end),)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, start: tuple[float, float], end: tuple[float, float], route: dict):
+        payload = json.dumps(route, separators=(",", ":"))
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO routes (key, route) VALUES (?, ?)", (self._key(start, end), payload))
+            self.conn.commit()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
 def extract_route_signature(
     address_id: str,
     address: str,
     location: tuple[float, float],
     station_loc: tuple[float, float],
     routing_url: str,
-    routing_engine: str = "graphhopper"
+    routing_engine: str = "graphhopper",
+    route_cache: Optional[RouteCache] = None
 ) -> RouteSignature:
     """Calculate route and extract signature for comparison."""
-    route = get_route(routing_url, station_loc, location, routing_engine)
+    route = route_cache.get(station_loc, location) if route_cache else None
+    if route is None:
+        route = get_route(routing_url, station_loc, location, routing_engine)
+        # Failed lookups aren't cached so they're retried next run
+        if route and route_cache:
+            route_cache.put(station_loc, location, route)
 
     if not route:
         return RouteSignature(
@@ -222,7 +358,6 @@ def extract_route_signature(
             initial_bearing=0,
             first_road="",
             route_roads=[],
-            route_geometry=[],
             total_distance=0,
             total_duration=0,
             has_uturn=False,
@@ -234,12 +369,18 @@ def extract_route_signature(
     legs = route.get("legs", [{}])
     steps = legs[0].get("steps", []) if legs else []
 
-    # Calculate initial bearing from first two points of route
-    initial_bearing = 0
-    if len(geometry) >= 2:
-        p1 = geometry[0]
-        p2 = geometry[1]
-        initial_bearing = calculate_bearing(p1[1], p1[0], p2[1], p2[0])
+    # Convert the geometry to contiguous arrays once; overlap checks reuse them.
+    # initial_bearing is filled in later by assign_initial_bearings.
+    # A route with no geometry keeps empty arrays: no bearing, tree or overlap
+    if geometry:
+        route_xy = np.asarray(geometry, dtype=np.float64).reshape(len(geometry), -1)[:, :2]
+    else:
+        route_xy = np.empty((0, 2), dtype=np.float64)
+    scaled_xy = route_xy * np.array([LNG_SCALE, LAT_SCALE], dtype=np.float64)
+    keep = resample_route(scaled_xy)
+    route_xy, scaled_xy = route_xy[keep], scaled_xy[keep]
+    route_tree = KDTree(scaled_xy) if len(scaled_xy) else None
+    bbox = np.concatenate([scaled_xy.min(axis=0), scaled_xy.max(axis=0)]) if len(scaled_xy) else None
 
     # Get first road name (skip the first "depart" step)
     # GraphHopper uses "street_name", OSRM uses "name"
@@ -267,38 +408,64 @@ def extract_route_signature(
         address_id=address_id,
         address=address,
         location=location,
-        initial_bearing=initial_bearing,
+        initial_bearing=0,
         first_road=first_road,
         route_roads=route_roads,
-        route_geometry=geometry,
         total_distance=route.get("distance", 0),
         total_duration=route.get("duration", 0),
         has_uturn=has_uturn,
-        success=True
+        success=True,
+        route_xy=route_xy,
+        scaled_xy=scaled_xy,
+        route_tree=route_tree,
+        bbox=bbox
     )
 
 
-def calculate_route_overlap(route1: list, route2: list, threshold_m: float = 50) -> float:
+def resample_route(scaled_xy: np.ndarray, spacing_m: float = ROUTE_SAMPLE_SPACING_M) -> np.ndarray:
     """
-    Calculate what percentage of route1 is within threshold_m of route2.
+    Return indices of route points spaced roughly spacing_m apart along the
+    route (first point of each spacing_m stretch, plus the final point).
+    Dense GPS-like geometry adds nothing to a 50m overlap test but costs
+    tree queries. The first segment is always kept intact so the initial
+    bearing can be taken from route_xy.
+    """
+    if len(scaled_xy) <= 2:
+        return np.arange(len(scaled_xy))
+
+    seg = np.hypot(*np.diff(scaled_xy, axis=0).T)
+    along = np.concatenate([[0.0], np.cumsum(seg)])
+    _, keep = np.unique((along // spacing_m).astype(np.int64), return_index=True)
+    # A short route can fall entirely in the first bucket, leaving only index 0
+    if len(keep) < 2 or keep[1] != 1:
+        keep = np.insert(keep, 1, 1)
+    if keep[-1] != len(scaled_xy) - 1:
+        keep = np.append(keep, len(scaled_xy) - 1)
+    return keep
+
+
+def calculate_route_overlap(sig1: RouteSignature, sig2: RouteSignature, threshold_m: float = 50) -> float:
+    """
+    Calculate what percentage of sig1's route is within threshold_m of sig2's route.
     Returns 0-1 overlap score.
+
+    Each route point of sig1 is looked up in sig2's KD-tree, so the cost is
+    O(N log M) rather than comparing every pair of points.
     """
-    if not route1 or not route2:
+    if sig1.route_tree is None or sig2.route_tree is None:
         return 0.0
 
-    # Sample points from route1
-    matches = 0
-    total = len(route1)
+    # Routes whose bounding boxes are further apart than the threshold can't overlap
+    b1, b2 = sig1.bbox, sig2.bbox
+    if (b1[0] > b2[2] + threshold_m or b2[0] > b1[2] + threshold_m or
+            b1[1] > b2[3] + threshold_m or b2[1] > b1[3] + threshold_m):
+        return 0.0
 
-    for p1 in route1:
-        # Check if any point in route2 is within threshold
-        for p2 in route2:
-            dist = haversine_distance(p1[1], p1[0], p2[1], p2[0])
-            if dist <= threshold_m:
-                matches += 1
-                break
+    tree2 = sig2.route_tree
+    _, idx = tree2.query(sig1.scaled_xy, distance_upper_bound=threshold_m)
 
-    return matches / total if total > 0 else 0.0
+    # Points with no neighbor within the bound get index == tree size
+    return float(np.count_nonzero(idx != tree2.n)) / len(idx)
 
 
 def find_instabilities(
@@ -313,115 +480,120 @@ def find_instabilities(
     # Build KD-tree for fast neighbor lookup
     # Note: KDTree uses Euclidean distance, so we need to convert to approximate meters
     # At 39°N latitude, 1 degree lat ≈ 111km, 1 degree lng ≈ 85km
-    lat_scale = 111000
-    lng_scale = 85000
-
-    scaled_coords = addresses_coords.copy()
-    scaled_coords[:, 0] *= lng_scale  # longitude
-    scaled_coords[:, 1] *= lat_scale  # latitude
+    addresses_coords = np.ascontiguousarray(addresses_coords, dtype=np.float64)
+    scaled_coords = addresses_coords * np.array([LNG_SCALE, LAT_SCALE], dtype=np.float64)
 
     tree = KDTree(scaled_coords)
 
-    instabilities = []
-    checked_pairs = set()
+    # Every unique (i, j) pair with i < j within range, in one call;
+    # sorted so output order is stable between runs
+    pairs = tree.query_pairs(max_neighbor_distance, output_type='ndarray')
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
 
-    for i, sig1 in enumerate(signatures):
-        if not sig1.success:
-            continue
+    i_arr, j_arr = pairs[:, 0], pairs[:, 1]
 
-        # Find neighbors within max_neighbor_distance
-        point = scaled_coords[i]
-        neighbor_indices = tree.query_ball_point(point, max_neighbor_distance)
-
-        for j in neighbor_indices:
-            if i >= j:  # Avoid duplicates and self-comparison
-                continue
-
-            pair_key = (min(i, j), max(i, j))
-            if pair_key in checked_pairs:
-                continue
-            checked_pairs.add(pair_key)
-
-            sig2 = signatures[j]
-            if not sig2.success:
-                continue
-
-            # Calculate actual distance between addresses
-            dist = haversine_distance(
-                sig1.location[1], sig1.location[0],
-                sig2.location[1], sig2.location[0]
-            )
-
-            # Calculate bearing difference
-            bearing_diff = abs(sig1.initial_bearing - sig2.initial_bearing)
-            if bearing_diff > 180:
-                bearing_diff = 360 - bearing_diff
-
-            # Calculate route overlap
-            overlap = calculate_route_overlap(sig1.route_geometry, sig2.route_geometry)
-
-            # Determine if this is an instability
-            is_instability = False
-            severity = "medium"
-
-            # Check for different route characteristics
-            distance_diff = abs(sig1.total_distance - sig2.total_distance)
-            distance_ratio = max(sig1.total_distance, sig2.total_distance) / max(min(sig1.total_distance, sig2.total_distance), 1)
-            roads_differ = sig1.route_roads[:3] != sig2.route_roads[:3]  # First 3 roads differ
-            uturn_mismatch = sig1.has_uturn != sig2.has_uturn
-
-            reason = ""
-            if bearing_diff >= bearing_threshold:
-                # Different initial direction - this is the dangerous case!
-                is_instability = True
-                severity = "critical" if bearing_diff >= 150 else "high"
-                reason = f"Opposite initial direction ({bearing_diff:.0f}° diff)"
-            elif uturn_mismatch:
-                # One route has U-turn, other doesn't - suspicious!
-                is_instability = True
-                severity = "critical" if distance_ratio > 1.3 else "high"
-                uturn_addr = sig1.address if sig1.has_uturn else sig2.address
-                reason = f"U-turn route mismatch (one has U-turn, {distance_ratio:.1f}x longer)"
-            elif roads_differ and distance_ratio > 1.2:
-                # Different roads AND significantly longer route
-                is_instability = True
-                severity = "high" if distance_ratio > 1.4 else "medium"
-                reason = f"Different roads ({distance_ratio:.1f}x distance diff)"
-            elif bearing_diff >= 45 and overlap < 0.4:
+    # Cheap per-pair metrics for all pairs at once
+    bearings = np.array([s.initial_bearing for s in signatures], dtype=np.float64)
+    totals = np.array([s.total_distance for s in signatures], dtype=np.float64)
+    uturns = np.array([s.has_uturn for s in signatures], dtype=bool)
+    success = np.array([s.success for s in signatures], dtype=bool)
+
+    # Integer id per distinct first-three-roads prefix, so prefixes compare as ints
+    road_ids = {}
+    road_keys = np.array([road_ids.setdefault(tuple(s.route_roads[:3]), len(road_ids)) for s in signatures],
+                         dtype=np.int64)
+
+    bearing_diffs = np.abs(bearings[i_arr] - bearings[j_arr])
+    bearing_diffs = np.minimum(bearing_diffs, 360 - bearing_diffs)
+
+    d1, d2 = totals[i_arr], totals[j_arr]
+    distance_ratios = np.maximum(d1, d2) / np.maximum(np.minimum(d1, d2), 1)
+
+    uturn_mismatches = uturns[i_arr] != uturns[j_arr]
+    roads_differ = road_keys[i_arr] != road_keys[j_arr]
+
+    # Pairs failing all of these can't match any rule below
+    candidates = success[i_arr] & success[j_arr] & (
+        (bearing_diffs >= min(30, bearing_threshold)) | uturn_mismatches | (roads_differ & (distance_ratios > 1.2))
+    )
+    keep = np.flatnonzero(candidates)
+    i_arr, j_arr = i_arr[keep], j_arr[keep]
+    bearing_diffs, distance_ratios = bearing_diffs[keep], distance_ratios[keep]
+    uturn_mismatches, roads_differ = uturn_mismatches[keep], roads_differ[keep]
+
+    dists = haversine_distances(
+        addresses_coords[i_arr, 1], addresses_coords[i_arr, 0],
+        addresses_coords[j_arr, 1], addresses_coords[j_arr, 0]
+    )
+
+    instabilities = []
+
+    for k in range(len(i_arr)):
+        sig1 = signatures[i_arr[k]]
+        sig2 = signatures[j_arr[k]]
+
+        dist = float(dists[k])
+        bearing_diff = float(bearing_diffs[k])
+        distance_ratio = float(distance_ratios[k])
+        uturn_mismatch = bool(uturn_mismatches[k])
+
+        # Route overlap is only computed when a rule needs it (see below)
+        overlap = None
+
+        # Determine if this is an instability
+        is_instability = False
+        severity = "medium"
+
+        reason = ""
+        if bearing_diff >= bearing_threshold:
+            # Different initial direction - this is the dangerous case!
+            is_instability = True
+            severity = "critical" if bearing_diff >= 150 else "high"
+            reason = f"Opposite initial direction ({bearing_diff:.0f}° diff)"
+        elif uturn_mismatch:
+            # One route has U-turn, other doesn't - suspicious!
+            is_instability = True
+            severity = "critical" if distance_ratio > 1.3 else "high"
+            uturn_addr = sig1.address if sig1.has_uturn else sig2.address
+            reason = f"U-turn route mismatch (one has U-turn, {distance_ratio:.1f}x longer)"
+        elif roads_differ[k] and distance_ratio > 1.2:
+            # Different roads AND significantly longer route
+            is_instability = True
+            severity = "high" if distance_ratio > 1.4 else "medium"
+            reason = f"Different roads ({distance_ratio:.1f}x distance diff)"
+        elif bearing_diff >= 30:
+            overlap = calculate_route_overlap(sig1, sig2)
+            if bearing_diff >= 45 and overlap < 0.4:
                 # Moderate bearing diff + low overlap = potential issue
                 is_instability = True
                 severity = "high"
                 reason = f"Bearing diff {bearing_diff:.0f}° + low overlap"
-            elif bearing_diff >= 30 and overlap < overlap_threshold:
+            elif overlap < overlap_threshold:
                 # Slight bearing diff + very low overlap
                 is_instability = True
                 severity = "medium"
                 reason = f"Bearing diff {bearing_diff:.0f}° + low overlap"
 
-            if is_instability:
-                instabilities.append(InstabilityZone(
-                    address1=sig1,
-                    address2=sig2,
-                    distance_apart=dist,
-                    route_distance_ratio=distance_ratio,
-                    reason=reason,
-                    bearing_difference=bearing_diff,
-                    route_overlap=overlap,
-                    severity=severity
-                ))
+        if is_instability:
+            if overlap is None:
+                # Still reported for flagged pairs
+                overlap = calculate_route_overlap(sig1, sig2)
+            instabilities.append(InstabilityZone(
+                address1=sig1,
+                address2=sig2,
+                distance_apart=dist,
+                route_distance_ratio=distance_ratio,
+                reason=reason,
+                bearing_difference=bearing_diff,
+                route_overlap=overlap,
+                severity=severity
+            ))
 
     return instabilities
 
 
-def export_results(
-    instabilities: list[InstabilityZone],
-    output_file: Path,
-    station_pattern: str
-):
-    """Export results as GeoJSON for visualization."""
-
-    features = []
-
+def iter_instability_features(instabilities: list[InstabilityZone]):
+    """Yield the GeoJSON features for each instability zone, one at a time."""
     # Add instability zones as lines connecting the two addresses
     for idx, zone in enumerate(instabilities):
         # Line connecting the two addresses
@@ -457,7 +629,7 @@ def export_results(
                 "reason": zone.reason
             }
         }
-        features.append(line_feature)
+        yield line_feature
 
         # Point markers for each address in the pair
         for i, addr in enumerate([zone.address1, zone.address2]):
@@ -481,22 +653,41 @@ def export_results(
                     "pair_index": i + 1
                 }
             }
-            features.append(point_feature)
-
-    geojson = {
-        "type": "FeatureCollection",
-        "properties": {
-            "station_pattern": station_pattern,
-            "total_instabilities": len(instabilities),
-            "critical_count": len([z for z in instabilities if z.severity == "critical"]),
-            "high_count": len([z for z in instabilities if z.severity == "high"]),
-            "medium_count": len([z for z in instabilities if z.severity == "medium"])
-        },
-        "features": features
+            yield point_feature
+
+
+def dump_json_bytes(obj) -> bytes:
+    """Serialize obj compactly to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def export_results(
+    instabilities: list[InstabilityZone],
+    output_file: Path,
+    station_pattern: str
+):
+    """
+    Export results as GeoJSON for visualization.
+
+    Features are written one per line as they're generated, so memory use
+    doesn't grow with the number of zones.
+    """
+    properties = {
+        "station_pattern": station_pattern,
+        "total_instabilities": len(instabilities),
+        "critical_count": len([z for z in instabilities if z.severity == "critical"]),
+        "high_count": len([z for z in instabilities if z.severity == "high"]),
+        "medium_count": len([z for z in instabilities if z.severity == "medium"])
     }
 
-    with open(output_file, "w") as f:
-        json.dump(geojson, f, indent=2)
+    with open(output_file, "wb") as f:
+        f.write(b'{"type":"FeatureCollection","properties":' + dump_json_bytes(properties) + b',"features":[')
+        for n, feature in enumerate(iter_instability_features(instabilities)):
+            f.write(b",\n" if n else b"\n")
+            f.write(dump_json_bytes(feature))
+        f.write(b"\n]}\n")
 
     print(f"\nResults saved to {output_file}")
 
@@ -513,6 +704,10 @@ def main():
                         help="Route overlap below this is flagged (0-1)")
     parser.add_argument("--max-neighbor-distance", type=float, default=50,
                         help="Max distance (meters) between addresses to compare")
+    parser.add_argument("--workers", type=int, default=16,
+                        help="Concurrent routing requests (default: 16)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore and don't update the on-disk route cache")
     parser.add_argument("--limit", type=int, default=None,
                         help="Limit number of addresses to analyze (for testing)")
     parser.add_argument("--output", type=str, default=None,
@@ -565,47 +760,62 @@ def main():
     print(f"{args.engine} connection OK")
 
     # Extract route signatures for all addresses
-    print(f"\nCalculating routes for {len(addresses)} addresses...")
-    signatures = []
-    coords = []
-
-    for i, feature in enumerate(addresses):
-        props = feature.get("properties", {})
-        geom = feature.get("geometry", {})
-
-        if geom.get("type") != "Point":
-            continue
-
-        coord = geom.get("coordinates", [])
-        if len(coord) < 2:
-            continue
-
-        street_addr = props.get("address", props.get("FULL_ADDRESS", props.get("full_address", f"Address {i}")))
-        city = props.get("city", "")
-        address = f"{street_addr}, {city}" if city else street_addr
-        address_id = props.get("id", str(i))
-        location = (coord[0], coord[1])
+    print(f"\nCalculating routes for {len(addresses)} addresses ({args.workers} concurrent requests)...")
+    records = prepare_address_records(addresses)
 
-        sig = extract_route_signature(
+    def route_record(record):
+        address_id, address, location = record
+        return extract_route_signature(
             address_id=address_id,
             address=address,
             location=location,
             station_loc=station_loc,
             routing_url=args.routing_url,
-            routing_engine=args.engine
+            routing_engine=args.engine,
+            route_cache=route_cache
         )
 
-        signatures.append(sig)
-        coords.append([coord[0], coord[1]])
+    route_cache = None if args.no_cache else RouteCache(ROUTE_CACHE_FILE, args.engine, args.routing_url)
+
+    # Addresses at the same spot (to ~1m, e.g. units in one building) share a route
+    location_index = {}
+    unique_records = []
+    for record in records:
+        key = (round(record[2][0], 5), round(record[2][1], 5))
+        if key not in location_index:
+            location_index[key] = len(unique_records)
+            unique_records.append(record)
 
-        # Progress indicator
-        if (i + 1) % 100 == 0:
-            print(f"  Processed {i + 1}/{len(addresses)} addresses...")
+    if len(unique_records) < len(records):
+        print(f"  {len(records) - len(unique_records)} addresses share a location with another; routing {len(unique_records)}")
+
+    # Routing calls are I/O-bound, so overlap them; map() keeps results in address order
+    routed = []
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            for sig in pool.map(route_record, unique_records):
+                routed.append(sig)
+
+                # Progress indicator
+                if len(routed) % 100 == 0:
+                    print(f"  Processed {len(routed)}/{len(unique_records)} locations...")
+    finally:
+        if route_cache:
+            route_cache.close()
+
+    signatures = []
+    for address_id, address, location in records:
+        sig = routed[location_index[(round(location[0], 5), round(location[1], 5))]]
+        if sig.address_id != address_id or sig.address != address:
+            sig = replace(sig, address_id=address_id, address=address, location=location)
+        signatures.append(sig)
 
     print(f"Successfully routed to {len([s for s in signatures if s.success])}/{len(signatures)} addresses")
 
-    # Convert coords to numpy array
-    coords_array = np.array(coords)
+    assign_initial_bearings(signatures)
+
+    # Address locations as an (N, 2) lng/lat array, in signature order
+    coords_array = np.array([location for _, _, location in records], dtype=np.float64).reshape(-1, 2)
 
     # Find instabilities
     print(f"\nAnalyzing for routing instabilities...")
@@ -9,15 +9,98 @@ import time
 from pathlib import Path
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / "data" / "gis"
 
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+NOMINATIM_MIN_INTERVAL = 1.1  # Nominatim usage policy: at most 1 request per second
+NOMINATIM_RETRIES = 2  # Extra attempts after a throttled or gateway error response
+NOMINATIM_RETRY_STATUSES = (429, 502, 503, 504)
+
+# Results from previous runs, keyed by full address ([lng, lat] or null for no match)
+GEOCODE_CACHE_FILE = DATA_DIR / "geocode_cache.json"
+
+_last_request_time = 0.0
+
+
+def create_session() -> requests.Session:
+    """
+    Create the keep-alive session used for all Nominatim requests.
+
+    No urllib3 retries are mounted: they would resend outside the
+    wait_for_rate_limit pacing, so nominatim_get retries instead.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = "KVFD_Quiz_Geocoder/1.0"
+    return session
+
+
+SESSION = create_session()
+
+
+def wait_for_rate_limit():
+    """Sleep only as long as needed to keep requests NOMINATIM_MIN_INTERVAL apart."""
+    global _last_request_time
+    delay = _last_request_time + NOMINATIM_MIN_INTERVAL - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    _last_request_time = time.monotonic()
+
+
+def nominatim_get(params: dict) -> requests.Response:
+    """
+    GET a Nominatim search, retrying throttled (429) and gateway errors.
 
-def geocode_address(address: str, city: str, state: str, zip_code: str) -> tuple[float, float] | None:
-    """Geocode an address using Nominatim."""
+    Every attempt goes through wait_for_rate_limit, and a Retry-After header
+    (or an exponential backoff) is honoured before the next one.
+    """
+    for attempt in range(NOMINATIM_RETRIES + 1):
+        wait_for_rate_limit()
+        try:
+            response = SESSION.get(NOMINATIM_URL, params=params, timeout=10)
+        except requests.exceptions.ConnectionError:
+            if attempt == NOMINATIM_RETRIES:
+                raise
+            continue
+
+        if response.status_code not in NOMINATIM_RETRY_STATUSES or attempt == NOMINATIM_RETRIES:
+            return response
+
+        retry_after = response.headers.get("Retry-After", "")
+        time.sleep(int(retry_after) if retry_after.isdigit() else NOMINATIM_MIN_INTERVAL * 2 ** attempt)
+
+
+def load_geocode_cache() -> dict:
+    """Load cached geocoding results, or an empty cache."""
+    if not GEOCODE_CACHE_FILE.exists():
+        return {}
+    with open(GEOCODE_CACHE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_geocode_cache(cache: dict):
+    """Persist geocoding results for the next run."""
+    with open(GEOCODE_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def geocode_address(address: str, city: str, state: str, zip_code: str, cache: dict | None = None) -> tuple[float, float] | None:
+    """
+    Geocode an address using Nominatim.
+    If cache is given, it is consulted first and updated with the result
+    (request errors are not cached, so they're retried next time).
+    """
     full_address = f"{address}, {city}, {state} {zip_code}"
 
+    if cache is not None and full_address in cache:
+        cached = cache[full_address]
+        return tuple(cached) if cached else None
+
     params = {
         "q": full_address,
         "format": "json",
@@ -25,21 +108,21 @@ def geocode_address(address: str, city: str, state: str, zip_code: str) -> tuple
         "countrycodes": "us"
     }
 
-    headers = {
-        "User-Agent": "KVFD_Quiz_Geocoder/1.0"
-    }
-
     try:
-        response = requests.get(NOMINATIM_URL, params=params, headers=headers, timeout=10)
+        response = nominatim_get(params)
         response.raise_for_status()
 
-        results = response.json()
+        results = orjson.loads(response.content) if orjson is not None else response.json()
         if results:
             lat = float(results[0]["lat"])
             lon = float(results[0]["lon"])
+            if cache is not None:
+                cache[full_address] = [lon, lat]
             return (lon, lat)  # GeoJSON uses [lng, lat]
         else:
             print(f"  No results for: {full_address}")
+            if cache is not None:
+                cache[full_address] = None
             return None
 
     except Exception as e:
@@ -51,11 +134,15 @@ def geocode_geojson(input_file: Path, output_file: Path):
     """Geocode all features in a GeoJSON file."""
     print(f"\nProcessing {input_file.name}...")
 
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(input_file.read_bytes())
+    else:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
     features = data.get("features", [])
     updated = 0
+    cache = load_geocode_cache()
 
     for i, feature in enumerate(features):
         props = feature.get("properties", {})
@@ -71,7 +158,7 @@ def geocode_geojson(input_file: Path, output_file: Path):
 
         print(f"  [{i+1}/{len(features)}] Geocoding: {name}")
 
-        coords = geocode_address(address, city, state, zip_code)
+        coords = geocode_address(address, city, state, zip_code, cache)
 
         if coords:
             old_coords = feature.get("geometry", {}).get("coordinates", [])
@@ -79,12 +166,15 @@ def geocode_geojson(input_file: Path, output_file: Path):
             print(f"    {old_coords} -> {list(coords)}")
             updated += 1
 
-        # Rate limit: Nominatim requires 1 request per second
-        time.sleep(1.1)
+    # Rate limiting happens in geocode_address, only before real requests
+    save_geocode_cache(cache)
 
     # Save updated file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
 
     print(f"\nUpdated {updated}/{len(features)} coordinates")
     print(f"Saved to {output_file}")
@@ -5,6 +5,8 @@ Manages fire stations, hospitals, and nursing homes data.
 
 Commands:
   download-stations  Download official fire station data from MoCo GIS
+  download-hospitals Download official hospital data from MoCo GIS
+  download-all       Download both official datasets concurrently
   geocode           Geocode addresses to coordinates using Nominatim
   generate          Generate GeoJSON files from facilities.csv
   validate          Validate coordinates are within Montgomery County
@@ -14,16 +16,25 @@ import argparse
 import csv
 import json
 import os
+import re
 import sys
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, Iterable, List, Tuple
 
 try:
-    import requests
+    import orjson
 except ImportError:
-    print("Error: requests library required. Install with: pip install requests")
-    sys.exit(1)
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 
 # Montgomery County bounds (approximate)
@@ -38,22 +49,140 @@ MOCO_BOUNDS = {
 FIRE_STATIONS_URL = "https://gis3.montgomerycountymd.gov/arcgis/rest/services/GDX/fire_station_pts/FeatureServer/0/query"
 HOSPITALS_URL = "https://gis3.montgomerycountymd.gov/arcgis/rest/services/GDX/hospital_pts/FeatureServer/0/query"
 
+# facilities.csv columns, in file order
+CSV_FIELDS = ('type', 'id', 'name', 'short_name', 'address', 'city', 'state', 'zip',
+              'lng', 'lat', 'verified', 'station_type', 'station_number',
+              'is_trauma_center', 'trauma_level', 'is_stemi_center', 'is_stroke_center',
+              'stroke_level', 'is_burn_center', 'is_pediatric_center', 'has_helipad',
+              'facility_type', 'bed_count', 'cms_rating', 'apparatus')
+
+# Hospital capability flags; load_csv turns them into bools for hospital rows
+HOSPITAL_FLAG_COLUMNS = ('is_trauma_center', 'is_stemi_center', 'is_stroke_center',
+                         'is_burn_center', 'is_pediatric_center', 'has_helipad')
+
+# Name keywords used to match official hospital records to facilities
+HOSPITAL_KEYWORDS = ('suburban', 'holy cross', 'shady grove', 'adventist', 'medstar', 'nih', 'walter reed')
+
+# Address cleanup patterns, compiled once
+UNIT_INFO_RE = re.compile(r',?\s*(?:Bldg\.?|Building|Suite|Ste\.?|Room|Floor|Unit)\s*\d+\w*', re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
+DOUBLE_COMMA_RE = re.compile(r',\s*,')
+SIMPLE_ADDRESS_RE = re.compile(
+    r'^(\d+\s+\w+(?:\s+\w+)?(?:\s+(?:St|Street|Ave|Avenue|Rd|Road|Dr|Drive|Blvd|Boulevard|Ln|Lane|Way|Ct|Court|Pike|Pkwy|Parkway))?)',
+    re.IGNORECASE
+)
+STATION_NUMBER_RE = re.compile(r'Station\s*(\d+)')
+
 # Nominatim (OpenStreetMap) geocoding endpoint
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 
+# Geocoding results are cached between runs. Bump the version whenever the
+# query variants tried by geocode_address change, so old answers are ignored.
+GEOCODE_CACHE_FILE = "facility_geocode_cache.json"
+GEOCODE_CACHE_VERSION = 2
+
+# Nominatim usage policy: at most one request per second
+NOMINATIM_MIN_INTERVAL = 1.1
+NOMINATIM_RETRIES = 2  # Extra attempts after a throttled or gateway error response
+NOMINATIM_RETRY_STATUSES = (429, 502, 503, 504)
+_last_nominatim_request = 0.0
+
+
+def require_requests():
+    """
+    Import requests on first use.
+
+    Only the download and geocode commands talk to the network, so
+    generate/validate/export start without paying for the import.
+    """
+    try:
+        import requests
+    except ImportError:
+        print("Error: requests library required. Install with: pip install requests")
+        sys.exit(1)
+    return requests
+
+
+def create_session():
+    """
+    Create the HTTP session shared by geocoding and GIS downloads.
+
+    Keep-alive connections mean each geocoding attempt skips the TCP/TLS
+    handshake with Nominatim. Transient gateway errors from the GIS servers
+    are retried by urllib3; Nominatim gets an adapter without retries so
+    that nominatim_get can retry through the rate limiter instead.
+    """
+    requests = require_requests()
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'KVFD_Quiz/1.0 (Montgomery County EMS Training App)'
+    })
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Longest prefix wins, so Nominatim requests bypass the retrying adapter
+    session.mount(NOMINATIM_URL.rsplit('/', 1)[0], HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    return session
+
+
+@lru_cache(maxsize=1)
+def get_session():
+    """Return the shared HTTP session, creating it on first use."""
+    return create_session()
+
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory."""
     return Path(__file__).parent.parent
 
 
+@lru_cache(maxsize=1)
 def get_data_dir() -> Path:
-    """Get the GIS data directory."""
+    """Get the GIS data directory (created on first call)."""
     data_dir = get_project_root() / "data" / "gis"
     data_dir.mkdir(parents=True, exist_ok=True)
     return data_dir
 
 
+def read_json(path: Path):
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def iter_features(path: Path):
+    """Yield the features of a GeoJSON FeatureCollection one at a time.
+
+    Streams with ijson when it is installed so only one feature is held in
+    memory; otherwise falls back to parsing the whole file with read_json.
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'features.item', use_float=True)
+        return
+    yield from read_json(path).get('features', [])
+
+
+def write_json(path: Path, data, sort_keys: bool = False) -> None:
+    """Write data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        Path(path).write_bytes(orjson.dumps(data, option=option))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=sort_keys)
+
+
 def load_csv() -> List[Dict]:
     """Load facilities from CSV file."""
     csv_path = get_data_dir() / "facilities.csv"
@@ -75,63 +204,146 @@ def load_csv() -> List[Dict]:
             if row.get('cms_rating'):
                 row['cms_rating'] = int(row['cms_rating']) if row['cms_rating'] else None
             row['verified'] = row.get('verified', '').lower() == 'true'
+            if row.get('type') == 'hospital':
+                for column in HOSPITAL_FLAG_COLUMNS:
+                    row[column] = (row.get(column) or '').lower() == 'true'
             facilities.append(row)
 
     return facilities
 
 
-def save_csv(facilities: List[Dict]) -> None:
-    """Save facilities to CSV file."""
+def facility_to_row(facility: Dict) -> Tuple:
+    """Flatten a facility dict into a tuple in CSV_FIELDS order."""
+    # Hospital flags are written back in the sheet's lowercase form
+    if facility.get('type') == 'hospital':
+        facility = {**facility, **{column: 'true' if facility[column] else 'false'
+                                   for column in HOSPITAL_FLAG_COLUMNS
+                                   if isinstance(facility.get(column), bool)}}
+    return tuple(facility.get(column, '') for column in CSV_FIELDS)
+
+
+def write_csv_rows(rows: Iterable[Tuple]) -> Path:
+    """Write row tuples (in CSV_FIELDS order) to the CSV file and return its path."""
     csv_path = get_data_dir() / "facilities.csv"
 
-    # Determine fieldnames from first few records
-    fieldnames = ['type', 'id', 'name', 'short_name', 'address', 'city', 'state', 'zip',
-                  'lng', 'lat', 'verified', 'station_type', 'station_number',
-                  'is_trauma_center', 'trauma_level', 'is_stemi_center', 'is_stroke_center',
-                  'stroke_level', 'is_burn_center', 'is_pediatric_center', 'has_helipad',
-                  'facility_type', 'bed_count', 'cms_rating', 'apparatus']
+    # A 1 MiB buffer lets the whole sheet go out in a few large writes
+    with open(csv_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        writer.writerows(rows)
+
+    return csv_path
 
-    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        for facility in facilities:
-            writer.writerow(facility)
 
+def save_csv(facilities: List[Dict]) -> None:
+    """Save facilities to CSV file."""
+    csv_path = write_csv_rows(facility_to_row(facility) for facility in facilities)
     print(f"Saved {len(facilities)} facilities to {csv_path}")
 
 
 def clean_address(address: str) -> str:
     """Clean address by removing building numbers, suite info, etc."""
-    import re
+    # Remove building, suite, room, floor and unit info in one pass
+    address = UNIT_INFO_RE.sub('', address)
 
-    # Remove building info (Bldg, Building, Bld)
-    address = re.sub(r',?\s*Bldg\.?\s*\d+\w*', '', address, flags=re.IGNORECASE)
-    address = re.sub(r',?\s*Building\s*\d+\w*', '', address, flags=re.IGNORECASE)
+    # Clean up extra spaces and commas
+    address = WHITESPACE_RE.sub(' ', address).strip()
+    address = DOUBLE_COMMA_RE.sub(',', address)
+    address = address.rstrip(',').strip()
 
-    # Remove suite info
-    address = re.sub(r',?\s*Suite\s*\d+\w*', '', address, flags=re.IGNORECASE)
-    address = re.sub(r',?\s*Ste\.?\s*\d+\w*', '', address, flags=re.IGNORECASE)
+    return address
 
-    # Remove room/floor info
-    address = re.sub(r',?\s*Room\s*\d+\w*', '', address, flags=re.IGNORECASE)
-    address = re.sub(r',?\s*Floor\s*\d+\w*', '', address, flags=re.IGNORECASE)
 
-    # Remove unit info
-    address = re.sub(r',?\s*Unit\s*\d+\w*', '', address, flags=re.IGNORECASE)
+def geocode_cache_key(address: str, city: str, state: str, zip_code: str) -> str:
+    """Normalized cache key for an address."""
+    return (f"v{GEOCODE_CACHE_VERSION}|{address.lower().strip()}|{city.lower().strip()}|"
+            f"{state.upper().strip()}|{zip_code.strip()}")
 
-    # Clean up extra spaces and commas
-    address = re.sub(r'\s+', ' ', address).strip()
-    address = re.sub(r',\s*,', ',', address)
-    address = address.rstrip(',').strip()
 
-    return address
+def load_geocode_cache(ttl_days: float) -> Dict:
+    """
+    Load cached geocoding results, dropping entries older than ttl_days.
+    Entries are [lng, lat, timestamp]; lng/lat are null for addresses
+    Nominatim couldn't find.
+    """
+    cache_path = get_data_dir() / GEOCODE_CACHE_FILE
+    if not cache_path.exists():
+        return {}
+
+    # The cache is only an optimization; if it is unreadable, start from scratch
+    try:
+        cache = read_json(cache_path)
+    except (OSError, ValueError) as e:
+        print(f"Warning: ignoring unreadable geocode cache {cache_path}: {e}")
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+
+    # Skip hand-edited or truncated entries rather than failing on them
+    cutoff = time.time() - ttl_days * 86400
+    return {key: entry for key, entry in cache.items()
+            if isinstance(entry, list) and len(entry) == 3
+            and isinstance(entry[2], (int, float)) and entry[2] >= cutoff}
+
+
+def save_geocode_cache(cache: Dict) -> None:
+    """Write geocoding results for the next run."""
+    cache_path = get_data_dir() / GEOCODE_CACHE_FILE
+    write_json(cache_path, cache, sort_keys=True)
+
+
+def wait_for_nominatim() -> None:
+    """Sleep only as long as needed to keep Nominatim requests NOMINATIM_MIN_INTERVAL apart."""
+    global _last_nominatim_request
+    delay = _last_nominatim_request + NOMINATIM_MIN_INTERVAL - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    _last_nominatim_request = time.monotonic()
+
+
+def nominatim_get(params: Dict):
+    """
+    GET a Nominatim search, retrying throttled (429) and gateway errors.
+
+    Every attempt goes through wait_for_nominatim, and a Retry-After header
+    (or an exponential backoff) is honoured before the next one.
+    """
+    requests = require_requests()
+    for attempt in range(NOMINATIM_RETRIES + 1):
+        wait_for_nominatim()
+        try:
+            response = get_session().get(NOMINATIM_URL, params=params, timeout=10)
+        except requests.exceptions.ConnectionError:
+            if attempt == NOMINATIM_RETRIES:
+                raise
+            continue
+
+        if response.status_code not in NOMINATIM_RETRY_STATUSES or attempt == NOMINATIM_RETRIES:
+            return response
 
+        retry_after = response.headers.get('Retry-After', '')
+        time.sleep(int(retry_after) if retry_after.isdigit() else NOMINATIM_MIN_INTERVAL * 2 ** attempt)
 
-def geocode_address(address: str, city: str, state: str, zip_code: str) -> Optional[Tuple[float, float]]:
+
+def geocode_address(address: str, city: str, state: str, zip_code: str,
+                    cache: Optional[Dict] = None) -> Optional[Tuple[float, float]]:
     """
     Geocode an address using Nominatim (OpenStreetMap).
     Returns (longitude, latitude) or None if not found.
+
+    A structured query (street/city/state/postalcode) is tried first: it's
+    cheaper for Nominatim to answer and usually matches on the first try.
+    Free-form q= variants of the address are only tried if it finds nothing.
+    Requests are paced by wait_for_nominatim().
+
+    If cache is given it is checked first and updated with the answer;
+    "not found" is cached too, but request errors are not.
     """
+    key = geocode_cache_key(address, city, state, zip_code)
+    if cache is not None and key in cache:
+        lng, lat, _ = cache[key]
+        return (lng, lat) if lng is not None else None
+
     # Try with original address first
     addresses_to_try = [address]
 
@@ -141,41 +353,44 @@ def geocode_address(address: str, city: str, state: str, zip_code: str) -> Optio
         addresses_to_try.append(cleaned)
 
     # Also try with just street number and name (simpler)
-    import re
-    simple_match = re.match(r'^(\d+\s+\w+(?:\s+\w+)?(?:\s+(?:St|Street|Ave|Avenue|Rd|Road|Dr|Drive|Blvd|Boulevard|Ln|Lane|Way|Ct|Court|Pike|Pkwy|Parkway))?)', address, re.IGNORECASE)
+    simple_match = SIMPLE_ADDRESS_RE.match(address)
     if simple_match:
         simple_addr = simple_match.group(1)
         if simple_addr not in addresses_to_try:
             addresses_to_try.append(simple_addr)
 
-    headers = {
-        'User-Agent': 'KVFD_Quiz/1.0 (Montgomery County EMS Training App)'
-    }
+    structured = {'street': address, 'city': city, 'state': state, 'postalcode': zip_code}
+    queries = [{k: v for k, v in structured.items() if v}]
+    queries += [{'q': f"{addr}, {city}, {state} {zip_code}"} for addr in addresses_to_try]
 
-    for addr in addresses_to_try:
-        full_address = f"{addr}, {city}, {state} {zip_code}"
+    had_error = False
+    for query in queries:
+        description = query.get('q') or ', '.join(query.values())
 
         try:
             params = {
-                'q': full_address,
+                **query,
                 'format': 'json',
                 'limit': 1,
                 'countrycodes': 'us'
             }
 
-            response = requests.get(NOMINATIM_URL, params=params, headers=headers, timeout=10)
+            response = nominatim_get(params)
             response.raise_for_status()
 
             results = response.json()
             if results:
-                return (float(results[0]['lon']), float(results[0]['lat']))
-
-            # Small delay between retries
-            time.sleep(0.5)
+                coords = (float(results[0]['lon']), float(results[0]['lat']))
+                if cache is not None:
+                    cache[key] = [coords[0], coords[1], time.time()]
+                return coords
 
         except Exception as e:
-            print(f"  Geocoding error for '{full_address}': {e}")
+            print(f"  Geocoding error for '{description}': {e}")
+            had_error = True
 
+    if cache is not None and not had_error:
+        cache[key] = [None, None, time.time()]
     return None
 
 
@@ -185,30 +400,47 @@ def is_in_moco(lat: float, lng: float) -> bool:
             MOCO_BOUNDS['min_lng'] <= lng <= MOCO_BOUNDS['max_lng'])
 
 
+def download_official_layer(url: str, output_name: str) -> Tuple[List, Optional[Path]]:
+    """
+    Download a MoCo GIS layer as GeoJSON.
+    Saves it under the data directory when it has features; returns the
+    features and the saved path (None if nothing was saved).
+    """
+    params = {
+        'where': '1=1',
+        'outFields': '*',
+        'outSR': '4326',
+        'f': 'geojson'
+    }
+
+    response = get_session().get(url, params=params, timeout=30)
+    response.raise_for_status()
+
+    data = response.json()
+    features = data.get('features', [])
+    if not features:
+        return features, None
+
+    output_path = get_data_dir() / output_name
+    write_json(output_path, data)
+
+    return features, output_path
+
+
 # =============================================================================
 # COMMAND: download-stations
 # =============================================================================
 def cmd_download_stations(args) -> int:
     """Download official fire station data from Montgomery County GIS."""
+    requests = require_requests()
     print("\n" + "="*60)
     print("DOWNLOADING OFFICIAL FIRE STATION DATA")
     print("="*60)
     print(f"\nSource: {FIRE_STATIONS_URL}")
 
     try:
-        params = {
-            'where': '1=1',
-            'outFields': '*',
-            'outSR': '4326',
-            'f': 'geojson'
-        }
-
         print("Fetching fire station data from MoCo GIS...")
-        response = requests.get(FIRE_STATIONS_URL, params=params, timeout=30)
-        response.raise_for_status()
-
-        data = response.json()
-        features = data.get('features', [])
+        features, output_path = download_official_layer(FIRE_STATIONS_URL, "fire_stations_official.geojson")
 
         if not features:
             print("\nNo features found. The endpoint may have changed.")
@@ -227,11 +459,6 @@ def cmd_download_stations(args) -> int:
             coords = sample.get('geometry', {}).get('coordinates', [])
             print(f"  coordinates: [{coords[0]:.4f}, {coords[1]:.4f}]")
 
-        # Save raw GeoJSON
-        output_path = get_data_dir() / "fire_stations_official.geojson"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-
         print(f"\nSaved to: {output_path}")
         print("\nNow run 'export' to merge with facilities.csv")
         return 0
@@ -248,25 +475,15 @@ def cmd_download_stations(args) -> int:
 # =============================================================================
 def cmd_download_hospitals(args) -> int:
     """Download official hospital data from Montgomery County GIS."""
+    requests = require_requests()
     print("\n" + "="*60)
     print("DOWNLOADING OFFICIAL HOSPITAL DATA")
     print("="*60)
     print(f"\nSource: {HOSPITALS_URL}")
 
     try:
-        params = {
-            'where': '1=1',
-            'outFields': '*',
-            'outSR': '4326',
-            'f': 'geojson'
-        }
-
         print("Fetching hospital data from MoCo GIS...")
-        response = requests.get(HOSPITALS_URL, params=params, timeout=30)
-        response.raise_for_status()
-
-        data = response.json()
-        features = data.get('features', [])
+        features, output_path = download_official_layer(HOSPITALS_URL, "hospitals_official.geojson")
 
         if not features:
             print("\nNo features found.")
@@ -280,10 +497,6 @@ def cmd_download_hospitals(args) -> int:
             for key, value in list(sample.get('properties', {}).items())[:8]:
                 print(f"  {key}: {value}")
 
-        output_path = get_data_dir() / "hospitals_official.geojson"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-
         print(f"\nSaved to: {output_path}")
         return 0
 
@@ -292,6 +505,49 @@ def cmd_download_hospitals(args) -> int:
         return 1
 
 
+# =============================================================================
+# COMMAND: download-all
+# =============================================================================
+def cmd_download_all(args) -> int:
+    """Download official fire station and hospital data concurrently."""
+    requests = require_requests()
+    print("\n" + "="*60)
+    print("DOWNLOADING OFFICIAL GIS DATA")
+    print("="*60)
+
+    layers = [
+        ("fire stations", FIRE_STATIONS_URL, "fire_stations_official.geojson"),
+        ("hospitals", HOSPITALS_URL, "hospitals_official.geojson"),
+    ]
+
+    # The two layers are independent requests to the same host, so overlap them
+    print("\nFetching fire station and hospital data from MoCo GIS...")
+    with ThreadPoolExecutor(max_workers=len(layers)) as pool:
+        futures = [(label, pool.submit(download_official_layer, url, name)) for label, url, name in layers]
+
+    failed = 0
+    for label, future in futures:
+        try:
+            features, output_path = future.result()
+        except requests.exceptions.RequestException as e:
+            print(f"\n  {label}: download failed: {e}")
+            failed += 1
+            continue
+
+        if output_path is None:
+            print(f"\n  {label}: no features found. The endpoint may have changed.")
+            failed += 1
+        else:
+            print(f"\n  {label}: {len(features)} features saved to {output_path}")
+
+    if failed:
+        print("\nAlternative: Visit https://opendata-mcgov-gis.hub.arcgis.com/")
+        return 1
+
+    print("\nNow run 'merge-official' to merge with facilities.csv")
+    return 0
+
+
 # =============================================================================
 # COMMAND: merge-official
 # =============================================================================
@@ -315,8 +571,18 @@ def cmd_merge_official(args) -> int:
     stations_path = data_dir / "fire_stations_official.geojson"
     if stations_path.exists():
         print("\nMerging official fire station coordinates...")
-        with open(stations_path, 'r', encoding='utf-8') as f:
-            official = json.load(f)
+        official = read_json(stations_path)
+
+        # Index station facilities once instead of scanning them per official record
+        stations_by_num = {}
+        stations_by_prefix = defaultdict(list)
+        for facility in facilities:
+            if facility.get('type') != 'station':
+                continue
+            if facility.get('station_number'):
+                stations_by_num.setdefault(facility['station_number'], facility)
+            if facility.get('address'):
+                stations_by_prefix[facility['address'].lower().split()[0]].append(facility)
 
         for feature in official.get('features', []):
             props = feature.get('properties', {})
@@ -331,38 +597,36 @@ def cmd_merge_official(args) -> int:
             # Try to match by station number or address
             station_num = None
             if 'Station' in name:
-                import re
-                match = re.search(r'Station\s*(\d+)', name)
+                match = STATION_NUMBER_RE.search(name)
                 if match:
                     station_num = match.group(1)
 
-            for facility in facilities:
-                if facility.get('type') != 'station':
-                    continue
-
-                matched = False
-
-                # Match by station number
-                if station_num and facility.get('station_number') == station_num:
-                    matched = True
-                # Match by address (fuzzy)
-                elif address and facility.get('address') and address.lower().split()[0] in facility.get('address', '').lower():
-                    matched = True
-
-                if matched:
-                    facility['lng'] = coords[0]
-                    facility['lat'] = coords[1]
-                    facility['verified'] = 'true'
-                    # Update address/city from official data
-                    if address:
-                        facility['address'] = address
-                    if props.get('CITY'):
-                        facility['city'] = props['CITY']
-                    if props.get('ZIPCODE'):
-                        facility['zip'] = props['ZIPCODE']
-                    updated_stations += 1
-                    print(f"  Updated: Station {station_num or facility.get('station_number')} - [{coords[0]:.4f}, {coords[1]:.4f}]")
-                    break
+            # Match by station number, else by leading address token (house number)
+            facility = stations_by_num.get(station_num) if station_num else None
+            if facility is None and address.strip():
+                candidates = stations_by_prefix.get(address.lower().split()[0])
+                facility = candidates[0] if candidates else None
+
+            if facility is not None:
+                facility['lng'] = coords[0]
+                facility['lat'] = coords[1]
+                facility['verified'] = 'true'
+                # Update address/city from official data
+                if address:
+                    old_prefix = facility['address'].lower().split()[0] if facility.get('address') else None
+                    new_prefix = address.lower().split()[0] if address.strip() else None
+                    if old_prefix != new_prefix:
+                        if old_prefix:
+                            stations_by_prefix[old_prefix].remove(facility)
+                        if new_prefix:
+                            stations_by_prefix[new_prefix].append(facility)
+                    facility['address'] = address
+                if props.get('CITY'):
+                    facility['city'] = props['CITY']
+                if props.get('ZIPCODE'):
+                    facility['zip'] = props['ZIPCODE']
+                updated_stations += 1
+                print(f"  Updated: Station {station_num or facility.get('station_number')} - [{coords[0]:.4f}, {coords[1]:.4f}]")
 
         print(f"\n  Updated {updated_stations} fire stations from official data")
     else:
@@ -372,8 +636,16 @@ def cmd_merge_official(args) -> int:
     hospitals_path = data_dir / "hospitals_official.geojson"
     if hospitals_path.exists():
         print("\nMerging official hospital coordinates...")
-        with open(hospitals_path, 'r', encoding='utf-8') as f:
-            official = json.load(f)
+        official = read_json(hospitals_path)
+
+        # First hospital facility (in CSV order) whose name contains each keyword
+        hospitals = [f for f in facilities if f.get('type') == 'hospital']
+        first_hospital_by_keyword = {}
+        for index, facility in enumerate(hospitals):
+            facility_name = facility.get('name', '').lower()
+            for keyword in HOSPITAL_KEYWORDS:
+                if keyword in facility_name:
+                    first_hospital_by_keyword.setdefault(keyword, index)
 
         for feature in official.get('features', []):
             props = feature.get('properties', {})
@@ -385,34 +657,23 @@ def cmd_merge_official(args) -> int:
             name = props.get('NAME', '').lower()
             address = props.get('ADDRESS', '')
 
-            for facility in facilities:
-                if facility.get('type') != 'hospital':
-                    continue
-
-                facility_name = facility.get('name', '').lower()
-
-                # Match by name (partial)
-                matched = False
-                if name and facility_name:
-                    # Check if key words match
-                    for keyword in ['suburban', 'holy cross', 'shady grove', 'adventist', 'medstar', 'nih', 'walter reed']:
-                        if keyword in name and keyword in facility_name:
-                            matched = True
-                            break
-
-                if matched:
-                    facility['lng'] = coords[0]
-                    facility['lat'] = coords[1]
-                    facility['verified'] = 'true'
-                    if address:
-                        facility['address'] = address
-                    if props.get('CITY'):
-                        facility['city'] = props['CITY']
-                    if props.get('ZIPCODE'):
-                        facility['zip'] = props['ZIPCODE']
-                    updated_hospitals += 1
-                    print(f"  Updated: {facility.get('name')} - [{coords[0]:.4f}, {coords[1]:.4f}]")
-                    break
+            # Match by name: earliest facility sharing any keyword with the official name
+            matches = [first_hospital_by_keyword[keyword] for keyword in HOSPITAL_KEYWORDS
+                       if keyword in name and keyword in first_hospital_by_keyword]
+
+            if matches:
+                facility = hospitals[min(matches)]
+                facility['lng'] = coords[0]
+                facility['lat'] = coords[1]
+                facility['verified'] = 'true'
+                if address:
+                    facility['address'] = address
+                if props.get('CITY'):
+                    facility['city'] = props['CITY']
+                if props.get('ZIPCODE'):
+                    facility['zip'] = props['ZIPCODE']
+                updated_hospitals += 1
+                print(f"  Updated: {facility.get('name')} - [{coords[0]:.4f}, {coords[1]:.4f}]")
 
         print(f"\n  Updated {updated_hospitals} hospitals from official data")
     else:
@@ -457,6 +718,7 @@ def cmd_geocode(args) -> int:
     print(f"\nGeocoding {len(to_geocode)} facilities...")
     print("(Rate limited to 1 request/second for Nominatim)")
 
+    cache = load_geocode_cache(args.cache_ttl_days)
     geocoded = 0
     failed = 0
 
@@ -469,7 +731,8 @@ def cmd_geocode(args) -> int:
         print(f"\n[{i+1}/{len(to_geocode)}] {facility.get('name', 'Unknown')}")
         print(f"  Address: {address}, {city}, {state} {zip_code}")
 
-        coords = geocode_address(address, city, state, zip_code)
+        from_cache = geocode_cache_key(address, city, state, zip_code) in cache
+        coords = geocode_address(address, city, state, zip_code, cache)
 
         if coords:
             lng, lat = coords
@@ -486,9 +749,13 @@ def cmd_geocode(args) -> int:
             print(f"  FAILED: Could not geocode address")
             failed += 1
 
-        # Rate limiting for Nominatim
-        if i < len(to_geocode) - 1:
-            time.sleep(1.1)
+        if from_cache:
+            print("  (cached)")
+        elif (i + 1) % 10 == 0:
+            # Checkpoint the cache so an interrupted run keeps its progress
+            save_geocode_cache(cache)
+
+    save_geocode_cache(cache)
 
     # Save updated data
     save_csv(facilities)
@@ -502,6 +769,98 @@ def cmd_geocode(args) -> int:
     return 0 if failed == 0 else 1
 
 
+def build_hospital_feature(h: Dict) -> Dict:
+    """Build a hospitals.geojson feature from a facilities.csv row."""
+    return {
+        "type": "Feature",
+        "properties": {
+            "id": int(h.get('id', 0)),
+            "name": h.get('name', ''),
+            "short_name": h.get('short_name', ''),
+            "address": h.get('address', ''),
+            "city": h.get('city', ''),
+            "state": h.get('state', 'MD'),
+            "zip_code": h.get('zip', ''),
+            "is_trauma_center": h['is_trauma_center'],
+            "trauma_level": h.get('trauma_level') or None,
+            "is_stemi_center": h['is_stemi_center'],
+            "is_stroke_center": h['is_stroke_center'],
+            "stroke_level": h.get('stroke_level') or None,
+            "is_burn_center": h['is_burn_center'],
+            "is_pediatric_center": h['is_pediatric_center'],
+            "has_helipad": h['has_helipad'],
+        },
+        "geometry": {
+            "type": "Point",
+            "coordinates": [h['lng'], h['lat']]
+        }
+    }
+
+
+def build_station_feature(s: Dict) -> Dict:
+    """Build a fire_stations.geojson feature from a facilities.csv row."""
+    # Parse apparatus list
+    apparatus = []
+    if s.get('apparatus'):
+        apparatus = [a.strip() for a in s['apparatus'].split('|')]
+
+    # Handle non-numeric IDs
+    station_id = s.get('id', 0)
+    try:
+        station_id = int(station_id)
+    except (ValueError, TypeError):
+        station_id = hash(str(station_id)) % 10000  # Generate a numeric ID
+
+    return {
+        "type": "Feature",
+        "properties": {
+            "id": station_id,
+            "station_number": s.get('station_number', ''),
+            "station_name": s.get('name', ''),
+            "address": s.get('address', ''),
+            "city": s.get('city', ''),
+            "zip_code": s.get('zip', ''),
+            "station_type": s.get('station_type', 'career'),
+            "apparatus": apparatus
+        },
+        "geometry": {
+            "type": "Point",
+            "coordinates": [s['lng'], s['lat']]
+        }
+    }
+
+
+def build_nursing_feature(n: Dict) -> Dict:
+    """Build a nursing_homes.geojson feature from a facilities.csv row."""
+    return {
+        "type": "Feature",
+        "properties": {
+            "id": int(n.get('id', 0)),
+            "name": n.get('name', ''),
+            "short_name": n.get('short_name', ''),
+            "address": n.get('address', ''),
+            "city": n.get('city', ''),
+            "state": n.get('state', 'MD'),
+            "zip_code": n.get('zip', ''),
+            "facility_type": n.get('facility_type', 'nursing_home'),
+            "bed_count": n.get('bed_count'),
+            "cms_rating": n.get('cms_rating')
+        },
+        "geometry": {
+            "type": "Point",
+            "coordinates": [n['lng'], n['lat']]
+        }
+    }
+
+
+# facilities.csv type -> (output file, collection name, feature builder)
+GEOJSON_OUTPUTS = {
+    'hospital': ("hospitals.geojson", "Montgomery County Hospitals", build_hospital_feature),
+    'station': ("fire_stations.geojson", "Montgomery County Fire Stations", build_station_feature),
+    'nursing': ("nursing_homes.geojson", "Montgomery County Nursing Homes", build_nursing_feature),
+}
+
+
 # =============================================================================
 # COMMAND: generate
 # =============================================================================
@@ -517,144 +876,41 @@ def cmd_generate(args) -> int:
 
     data_dir = get_data_dir()
 
-    # Separate by type
-    hospitals = [f for f in facilities if f.get('type') == 'hospital']
-    stations = [f for f in facilities if f.get('type') == 'station']
-    nursing_homes = [f for f in facilities if f.get('type') == 'nursing']
-
-    print(f"\nFacilities: {len(hospitals)} hospitals, {len(stations)} stations, {len(nursing_homes)} nursing homes")
+    # One pass over facilities: build each feature and file it under its type
+    features_by_type = {facility_type: [] for facility_type in GEOJSON_OUTPUTS}
+    skipped_by_type = {facility_type: [] for facility_type in GEOJSON_OUTPUTS}
+    counts = dict.fromkeys(GEOJSON_OUTPUTS, 0)
 
-    # Generate hospitals.geojson
-    if hospitals:
-        hospital_features = []
-        for h in hospitals:
-            if not h.get('lng') or not h.get('lat'):
-                print(f"  Skipping {h.get('name')} - missing coordinates")
-                continue
-
-            feature = {
-                "type": "Feature",
-                "properties": {
-                    "id": int(h.get('id', 0)),
-                    "name": h.get('name', ''),
-                    "short_name": h.get('short_name', ''),
-                    "address": h.get('address', ''),
-                    "city": h.get('city', ''),
-                    "state": h.get('state', 'MD'),
-                    "zip_code": h.get('zip', ''),
-                    "is_trauma_center": h.get('is_trauma_center', '').lower() == 'true',
-                    "trauma_level": h.get('trauma_level') or None,
-                    "is_stemi_center": h.get('is_stemi_center', '').lower() == 'true',
-                    "is_stroke_center": h.get('is_stroke_center', '').lower() == 'true',
-                    "stroke_level": h.get('stroke_level') or None,
-                    "is_burn_center": h.get('is_burn_center', '').lower() == 'true',
-                    "is_pediatric_center": h.get('is_pediatric_center', '').lower() == 'true',
-                    "has_helipad": h.get('has_helipad', '').lower() == 'true',
-                },
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [h['lng'], h['lat']]
-                }
-            }
-            hospital_features.append(feature)
-
-        hospital_geojson = {
-            "type": "FeatureCollection",
-            "name": "Montgomery County Hospitals",
-            "features": hospital_features
-        }
-
-        with open(data_dir / "hospitals.geojson", 'w', encoding='utf-8') as f:
-            json.dump(hospital_geojson, f, indent=2)
-        print(f"  Generated hospitals.geojson ({len(hospital_features)} features)")
-
-    # Generate fire_stations.geojson
-    if stations:
-        station_features = []
-        for s in stations:
-            if not s.get('lng') or not s.get('lat'):
-                print(f"  Skipping Station {s.get('station_number')} - missing coordinates")
-                continue
+    for f in facilities:
+        facility_type = f.get('type')
+        if facility_type not in GEOJSON_OUTPUTS:
+            continue
+        counts[facility_type] += 1
 
-            # Parse apparatus list
-            apparatus = []
-            if s.get('apparatus'):
-                apparatus = [a.strip() for a in s['apparatus'].split('|')]
-
-            # Handle non-numeric IDs
-            station_id = s.get('id', 0)
-            try:
-                station_id = int(station_id)
-            except (ValueError, TypeError):
-                station_id = hash(str(station_id)) % 10000  # Generate a numeric ID
-
-            feature = {
-                "type": "Feature",
-                "properties": {
-                    "id": station_id,
-                    "station_number": s.get('station_number', ''),
-                    "station_name": s.get('name', ''),
-                    "address": s.get('address', ''),
-                    "city": s.get('city', ''),
-                    "zip_code": s.get('zip', ''),
-                    "station_type": s.get('station_type', 'career'),
-                    "apparatus": apparatus
-                },
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [s['lng'], s['lat']]
-                }
-            }
-            station_features.append(feature)
+        if not f.get('lng') or not f.get('lat'):
+            label = f"Station {f.get('station_number')}" if facility_type == 'station' else f.get('name')
+            skipped_by_type[facility_type].append(label)
+            continue
 
-        station_geojson = {
-            "type": "FeatureCollection",
-            "name": "Montgomery County Fire Stations",
-            "features": station_features
-        }
+        build_feature = GEOJSON_OUTPUTS[facility_type][2]
+        features_by_type[facility_type].append(build_feature(f))
 
-        with open(data_dir / "fire_stations.geojson", 'w', encoding='utf-8') as f:
-            json.dump(station_geojson, f, indent=2)
-        print(f"  Generated fire_stations.geojson ({len(station_features)} features)")
+    print(f"\nFacilities: {counts['hospital']} hospitals, {counts['station']} stations, {counts['nursing']} nursing homes")
 
-    # Generate nursing_homes.geojson
-    if nursing_homes:
-        nursing_features = []
-        for n in nursing_homes:
-            if not n.get('lng') or not n.get('lat'):
-                print(f"  Skipping {n.get('name')} - missing coordinates")
-                continue
+    for facility_type, (filename, collection_name, _) in GEOJSON_OUTPUTS.items():
+        if not counts[facility_type]:
+            continue
 
-            feature = {
-                "type": "Feature",
-                "properties": {
-                    "id": int(n.get('id', 0)),
-                    "name": n.get('name', ''),
-                    "short_name": n.get('short_name', ''),
-                    "address": n.get('address', ''),
-                    "city": n.get('city', ''),
-                    "state": n.get('state', 'MD'),
-                    "zip_code": n.get('zip', ''),
-                    "facility_type": n.get('facility_type', 'nursing_home'),
-                    "bed_count": n.get('bed_count'),
-                    "cms_rating": n.get('cms_rating')
-                },
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [n['lng'], n['lat']]
-                }
-            }
-            nursing_features.append(feature)
+        for label in skipped_by_type[facility_type]:
+            print(f"  Skipping {label} - missing coordinates")
 
-        nursing_geojson = {
+        features = features_by_type[facility_type]
+        write_json(data_dir / filename, {
             "type": "FeatureCollection",
-            "name": "Montgomery County Nursing Homes",
-            "features": nursing_features
-        }
-
-        with open(data_dir / "nursing_homes.geojson", 'w', encoding='utf-8') as f:
-            json.dump(nursing_geojson, f, indent=2)
-        print(f"  Generated nursing_homes.geojson ({len(nursing_features)} features)")
+            "name": collection_name,
+            "features": features
+        })
+        print(f"  Generated {filename} ({len(features)} features)")
 
     print("\nGeoJSON generation complete!")
     return 0
@@ -682,20 +938,27 @@ def cmd_validate(args) -> int:
     invalid = 0
     missing = 0
 
+    # Bounds hoisted out of the loop (same test as is_in_moco)
+    min_lat, max_lat = MOCO_BOUNDS['min_lat'], MOCO_BOUNDS['max_lat']
+    min_lng, max_lng = MOCO_BOUNDS['min_lng'], MOCO_BOUNDS['max_lng']
+
     for f in facilities:
-        name = f.get('name') or f.get('station_number') or 'Unknown'
+        lat = f.get('lat')
+        lng = f.get('lng')
 
-        if not f.get('lng') or not f.get('lat'):
+        if not lng or not lat:
+            name = f.get('name') or f.get('station_number') or 'Unknown'
             print(f"\n  MISSING: {name} - no coordinates")
             missing += 1
             continue
 
-        lat = float(f['lat'])
-        lng = float(f['lng'])
+        lat = float(lat)
+        lng = float(lng)
 
-        if is_in_moco(lat, lng):
+        if min_lat <= lat <= max_lat and min_lng <= lng <= max_lng:
             valid += 1
         else:
+            name = f.get('name') or f.get('station_number') or 'Unknown'
             print(f"\n  INVALID: {name}")
             print(f"    Coordinates: [{lng:.4f}, {lat:.4f}]")
             print(f"    Address: {f.get('address')}, {f.get('city')}")
@@ -714,6 +977,131 @@ def cmd_validate(args) -> int:
 # =============================================================================
 # COMMAND: export
 # =============================================================================
+# Sheet spelling of flag values that come back from GeoJSON as JSON literals
+CSV_FLAG_STRINGS = {True: 'true', False: 'false', None: '', '': ''}
+
+# Shared read-only default for features with no properties or geometry
+EMPTY_MAPPING = {}
+
+# Blank cells for the columns a row type does not use
+BLANK_HOSPITAL_COLUMNS = ('',) * 8   # is_trauma_center .. has_helipad
+BLANK_NURSING_COLUMNS = ('',) * 3    # facility_type, bed_count, cms_rating
+
+
+# Values used for properties missing from a hospitals.geojson feature
+HOSPITAL_EXPORT_DEFAULTS = {
+    'id': '', 'name': '', 'short_name': '', 'address': '', 'city': '', 'state': 'MD',
+    'zip_code': '', 'trauma_level': '', 'stroke_level': '',
+    **dict.fromkeys(HOSPITAL_FLAG_COLUMNS),
+}
+
+
+def csv_flag(value) -> str:
+    """Convert a GeoJSON flag value to its lowercase facilities.csv form."""
+    text = CSV_FLAG_STRINGS.get(value)
+    return text if text is not None else str(value).lower()
+
+
+def hospital_csv_row(props: Dict, lng, lat) -> Tuple:
+    """Build a facilities.csv row (CSV_FIELDS order) from a hospitals.geojson feature."""
+    # One merge fills every missing property, so the row can index directly
+    p = {**HOSPITAL_EXPORT_DEFAULTS, **props}
+    return (
+        'hospital',
+        p['id'],
+        p['name'],
+        p['short_name'],
+        p['address'],
+        p['city'],
+        p['state'],
+        p['zip_code'],
+        lng,
+        lat,
+        'false',
+        '',
+        '',
+        csv_flag(p['is_trauma_center']),
+        p['trauma_level'],
+        csv_flag(p['is_stemi_center']),
+        csv_flag(p['is_stroke_center']),
+        p['stroke_level'],
+        csv_flag(p['is_burn_center']),
+        csv_flag(p['is_pediatric_center']),
+        csv_flag(p['has_helipad']),
+    ) + BLANK_NURSING_COLUMNS + ('',)
+
+
+def station_csv_row(props: Dict, lng, lat) -> Tuple:
+    """Build a facilities.csv row (CSV_FIELDS order) from a fire_stations.geojson feature."""
+    # generate writes apparatus as a list (pipe-delimited in the sheet); a
+    # hand-made file may already hold the string, so only join non-strings
+    apparatus = props.get('apparatus') or ''
+    if not isinstance(apparatus, str):
+        apparatus = '|'.join(apparatus)
+
+    return (
+        'station',
+        props.get('id', ''),
+        props.get('station_name', ''),
+        f"Sta {props.get('station_number', '')}",
+        props.get('address', ''),
+        props.get('city', ''),
+        'MD',
+        props.get('zip_code', ''),
+        lng,
+        lat,
+        'false',
+        props.get('station_type', 'career'),
+        props.get('station_number', ''),
+    ) + BLANK_HOSPITAL_COLUMNS + BLANK_NURSING_COLUMNS + (apparatus,)
+
+
+def nursing_csv_row(props: Dict, lng, lat) -> Tuple:
+    """Build a facilities.csv row (CSV_FIELDS order) from a nursing_homes.geojson feature."""
+    return (
+        'nursing',
+        props.get('id', ''),
+        props.get('name', ''),
+        props.get('short_name', ''),
+        props.get('address', ''),
+        props.get('city', ''),
+        props.get('state', 'MD'),
+        props.get('zip_code', ''),
+        lng,
+        lat,
+        'false',
+        '',
+        '',
+    ) + BLANK_HOSPITAL_COLUMNS + (
+        props.get('facility_type', 'nursing_home'),
+        props.get('bed_count', ''),
+        props.get('cms_rating', ''),
+        '',
+    )
+
+
+# (source file, label for messages, row builder), in facilities.csv order
+CSV_EXPORT_SOURCES = (
+    ("hospitals.geojson", "hospitals", hospital_csv_row),
+    ("fire_stations.geojson", "fire stations", station_csv_row),
+    ("nursing_homes.geojson", "nursing homes", nursing_csv_row),
+)
+
+
+def load_export_rows(path: Path, build_row) -> Optional[List[Tuple]]:
+    """Read one GeoJSON file into facilities.csv rows; None if the file is missing."""
+    if not path.exists():
+        return None
+
+    rows = []
+    for feature in iter_features(path):
+        props = feature.get('properties') or EMPTY_MAPPING
+        coords = (feature.get('geometry') or EMPTY_MAPPING).get('coordinates')
+        lng, lat = (coords[0], coords[1]) if coords else ('', '')
+        rows.append(build_row(props, lng, lat))
+    return rows
+
+
 def cmd_export(args) -> int:
     """Export existing GeoJSON files to facilities.csv."""
     print("\n" + "="*60)
@@ -721,135 +1109,31 @@ def cmd_export(args) -> int:
     print("="*60)
 
     data_dir = get_data_dir()
-    facilities = []
 
-    # Load hospitals
-    hospitals_path = data_dir / "hospitals.geojson"
-    if hospitals_path.exists():
-        with open(hospitals_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            for feature in data.get('features', []):
-                props = feature.get('properties', {})
-                coords = feature.get('geometry', {}).get('coordinates', [None, None])
-
-                facilities.append({
-                    'type': 'hospital',
-                    'id': props.get('id', ''),
-                    'name': props.get('name', ''),
-                    'short_name': props.get('short_name', ''),
-                    'address': props.get('address', ''),
-                    'city': props.get('city', ''),
-                    'state': props.get('state', 'MD'),
-                    'zip': props.get('zip_code', ''),
-                    'lng': coords[0] if coords else '',
-                    'lat': coords[1] if coords else '',
-                    'verified': 'false',
-                    'station_type': '',
-                    'station_number': '',
-                    'is_trauma_center': str(props.get('is_trauma_center', '')).lower(),
-                    'trauma_level': props.get('trauma_level', ''),
-                    'is_stemi_center': str(props.get('is_stemi_center', '')).lower(),
-                    'is_stroke_center': str(props.get('is_stroke_center', '')).lower(),
-                    'stroke_level': props.get('stroke_level', ''),
-                    'is_burn_center': str(props.get('is_burn_center', '')).lower(),
-                    'is_pediatric_center': str(props.get('is_pediatric_center', '')).lower(),
-                    'has_helipad': str(props.get('has_helipad', '')).lower(),
-                    'facility_type': '',
-                    'bed_count': '',
-                    'cms_rating': '',
-                    'apparatus': ''
-                })
-        print(f"  Loaded {len([f for f in facilities if f['type'] == 'hospital'])} hospitals")
-
-    # Load fire stations
-    stations_path = data_dir / "fire_stations.geojson"
-    if stations_path.exists():
-        with open(stations_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            for feature in data.get('features', []):
-                props = feature.get('properties', {})
-                coords = feature.get('geometry', {}).get('coordinates', [None, None])
-
-                # Handle apparatus as pipe-delimited string
-                apparatus = props.get('apparatus', [])
-                if isinstance(apparatus, list):
-                    apparatus = '|'.join(apparatus)
-
-                facilities.append({
-                    'type': 'station',
-                    'id': props.get('id', ''),
-                    'name': props.get('station_name', ''),
-                    'short_name': f"Sta {props.get('station_number', '')}",
-                    'address': props.get('address', ''),
-                    'city': props.get('city', ''),
-                    'state': 'MD',
-                    'zip': props.get('zip_code', ''),
-                    'lng': coords[0] if coords else '',
-                    'lat': coords[1] if coords else '',
-                    'verified': 'false',
-                    'station_type': props.get('station_type', 'career'),
-                    'station_number': props.get('station_number', ''),
-                    'is_trauma_center': '',
-                    'trauma_level': '',
-                    'is_stemi_center': '',
-                    'is_stroke_center': '',
-                    'stroke_level': '',
-                    'is_burn_center': '',
-                    'is_pediatric_center': '',
-                    'has_helipad': '',
-                    'facility_type': '',
-                    'bed_count': '',
-                    'cms_rating': '',
-                    'apparatus': apparatus
-                })
-        print(f"  Loaded {len([f for f in facilities if f['type'] == 'station'])} fire stations")
-
-    # Load nursing homes
-    nursing_path = data_dir / "nursing_homes.geojson"
-    if nursing_path.exists():
-        with open(nursing_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            for feature in data.get('features', []):
-                props = feature.get('properties', {})
-                coords = feature.get('geometry', {}).get('coordinates', [None, None])
-
-                facilities.append({
-                    'type': 'nursing',
-                    'id': props.get('id', ''),
-                    'name': props.get('name', ''),
-                    'short_name': props.get('short_name', ''),
-                    'address': props.get('address', ''),
-                    'city': props.get('city', ''),
-                    'state': props.get('state', 'MD'),
-                    'zip': props.get('zip_code', ''),
-                    'lng': coords[0] if coords else '',
-                    'lat': coords[1] if coords else '',
-                    'verified': 'false',
-                    'station_type': '',
-                    'station_number': '',
-                    'is_trauma_center': '',
-                    'trauma_level': '',
-                    'is_stemi_center': '',
-                    'is_stroke_center': '',
-                    'stroke_level': '',
-                    'is_burn_center': '',
-                    'is_pediatric_center': '',
-                    'has_helipad': '',
-                    'facility_type': props.get('facility_type', 'nursing_home'),
-                    'bed_count': props.get('bed_count', ''),
-                    'cms_rating': props.get('cms_rating', ''),
-                    'apparatus': ''
-                })
-        print(f"  Loaded {len([f for f in facilities if f['type'] == 'nursing'])} nursing homes")
+    # The source files are independent, so read and parse them concurrently
+    with ThreadPoolExecutor(max_workers=len(CSV_EXPORT_SOURCES)) as pool:
+        results = list(pool.map(
+            load_export_rows,
+            [data_dir / filename for filename, _, _ in CSV_EXPORT_SOURCES],
+            [build_row for _, _, build_row in CSV_EXPORT_SOURCES]))
 
-    if not facilities:
+    loaded = []
+    for (_, label, _), rows in zip(CSV_EXPORT_SOURCES, results):
+        if rows is None:
+            continue
+        loaded.append(rows)
+        print(f"  Loaded {len(rows)} {label}")
+
+    total = sum(len(rows) for rows in loaded)
+    if not total:
         print("\nNo GeoJSON files found to export.")
         return 1
 
-    # Save to CSV
-    save_csv(facilities)
+    # Write each source's rows straight through without concatenating them first
+    csv_path = write_csv_rows(chain.from_iterable(loaded))
+    print(f"Saved {total} facilities to {csv_path}")
 
-    print(f"\nExported {len(facilities)} total facilities to facilities.csv")
+    print(f"\nExported {total} total facilities to facilities.csv")
     print("\nYou can now edit facilities.csv in Excel or Google Sheets.")
     print("After editing, run 'generate' to update the GeoJSON files.")
 
@@ -867,6 +1151,7 @@ def main():
 Examples:
   python manage_facilities.py export            # Export GeoJSON to CSV
   python manage_facilities.py download-stations # Download official fire station data
+  python manage_facilities.py download-all      # Download stations and hospitals together
   python manage_facilities.py geocode           # Geocode addresses without coordinates
   python manage_facilities.py geocode --force   # Re-geocode all addresses
   python manage_facilities.py validate          # Check all coordinates
@@ -886,6 +1171,11 @@ Examples:
         help='Download official hospital data from MoCo GIS')
     p_hospitals.set_defaults(func=cmd_download_hospitals)
 
+    # download-all
+    p_download_all = subparsers.add_parser('download-all',
+        help='Download official fire station and hospital data concurrently')
+    p_download_all.set_defaults(func=cmd_download_all)
+
     # merge-official
     p_merge = subparsers.add_parser('merge-official',
         help='Merge official GIS data into facilities.csv')
@@ -896,6 +1186,8 @@ Examples:
         help='Geocode addresses to coordinates')
     p_geocode.add_argument('--force', action='store_true',
         help='Re-geocode all addresses even if coordinates exist')
+    p_geocode.add_argument('--cache-ttl-days', type=float, default=90,
+        help='Ignore cached geocoding results older than this (default: 90, 0 disables the cache)')
     p_geocode.set_defaults(func=cmd_geocode)
 
     # generate
@@ -0,0 +1,35 @@
+"""Tests for scripts/find_routing_instabilities.py route geometry handling."""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import find_routing_instabilities as fri  # noqa: E402
+
+
+def test_resample_route_keeps_first_segment_and_end_of_short_route():
+    # All three points fall inside one 20 m bucket (e.g. an address next to the station)
+    keep = fri.resample_route(np.array([[0.0, 0.0], [5.0, 0.0], [10.0, 0.0]]))
+    assert keep.tolist() == [0, 1, 2]
+
+
+def test_resample_route_thins_dense_geometry():
+    scaled_xy = np.column_stack([np.arange(0.0, 101.0, 1.0), np.zeros(101)])
+    keep = fri.resample_route(scaled_xy)
+    assert keep.tolist() == [0, 1, 20, 40, 60, 80, 100]
+
+
+def test_extract_route_signature_handles_empty_geometry(monkeypatch):
+    route = {"geometry": {"coordinates": []}, "legs": [{"steps": []}], "distance": 0, "duration": 0}
+    monkeypatch.setattr(fri, "get_route", lambda *args, **kwargs: route)
+
+    sig = fri.extract_route_signature("1", "1 Main St", (39.0, -77.0), (39.0, -77.0), "http://localhost")
+    assert sig.success
+    assert sig.route_xy.shape == (0, 2)
+    assert sig.route_tree is None and sig.bbox is None
+
+    fri.assign_initial_bearings([sig])
+    assert sig.initial_bearing == 0
+    assert fri.calculate_route_overlap(sig, sig) == 0.0
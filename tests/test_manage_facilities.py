@@ -0,0 +1,84 @@
+"""Tests for official GIS merging and the geocode cache in scripts/manage_facilities.py."""
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import manage_facilities as mf  # noqa: E402
+
+
+def station(number, address):
+    return {'type': 'station', 'id': number, 'name': f"Station {number}", 'short_name': f"Sta {number}",
+            'address': address, 'city': 'Bethesda', 'state': 'MD', 'zip': '', 'lng': -77.0, 'lat': 39.0,
+            'verified': False, 'station_type': 'volunteer', 'station_number': number}
+
+
+def official_station(name, address, lng, lat):
+    return {'type': 'Feature',
+            'properties': {'NAME': name, 'ADDRESS': address, 'CITY': 'Bethesda', 'ZIPCODE': '20817'},
+            'geometry': {'type': 'Point', 'coordinates': [lng, lat]}}
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(mf, 'get_data_dir', lambda: tmp_path)
+    return tmp_path
+
+
+def merge_stations(data_dir, facilities, official):
+    mf.save_csv(facilities)
+    (data_dir / "fire_stations_official.geojson").write_text(
+        json.dumps({'type': 'FeatureCollection', 'features': official}), encoding='utf-8')
+    assert mf.cmd_merge_official(None) == 0
+    return {f['station_number']: f for f in mf.load_csv()}
+
+
+def test_station_number_match_wins_over_shared_house_number(data_dir):
+    # Station 7's address shares the house number of Station 10's official record
+    merged = merge_stations(data_dir, [
+        station('7', '8001 Connecticut Ave'),
+        station('10', '8201 River Rd'),
+    ], [
+        official_station('Station 10 - Cabin John', '8001 River Road', -77.15, 38.99),
+    ])
+
+    assert (merged['10']['lng'], merged['10']['lat']) == (-77.15, 38.99)
+    assert merged['10']['address'] == '8001 River Road'
+    assert (merged['7']['lng'], merged['7']['lat']) == (-77.0, 39.0)
+    assert merged['7']['address'] == '8001 Connecticut Ave'
+
+
+def test_address_fallback_compares_whole_house_number(data_dir):
+    # '380' is a substring of '13800' but not the same house number
+    merged = merge_stations(data_dir, [
+        station('3', '13800 Travilah Rd'),
+        station('23', '380 Hungerford Dr'),
+    ], [
+        official_station('Rockville Headquarters', '380 Hungerford Drive', -77.15, 39.08),
+    ])
+
+    assert (merged['23']['lng'], merged['23']['lat']) == (-77.15, 39.08)
+    assert (merged['3']['lng'], merged['3']['lat']) == (-77.0, 39.0)
+
+
+def test_load_geocode_cache_skips_malformed_entries(data_dir):
+    now = time.time()
+    (data_dir / mf.GEOCODE_CACHE_FILE).write_text(json.dumps({
+        'fresh': [-77.0, 39.0, now],
+        'miss': [None, None, now],
+        'stale': [-77.0, 39.0, now - 100 * 86400],
+        'short': [-77.0, 39.0],
+        'text_time': [-77.0, 39.0, 'yesterday'],
+        'not_a_list': 'oops',
+    }), encoding='utf-8')
+
+    assert sorted(mf.load_geocode_cache(ttl_days=90)) == ['fresh', 'miss']
+
+
+def test_load_geocode_cache_treats_unreadable_json_as_empty(data_dir):
+    (data_dir / mf.GEOCODE_CACHE_FILE).write_text('{"truncated": [', encoding='utf-8')
+    assert mf.load_geocode_cache(ttl_days=90) == {}